@@ -57,6 +57,10 @@ class EmailConfig:
 class DatabaseConfig:
     """Database configuration"""
     url: str = "sqlite:///hr_automation.db"
+    replica_url: str = ""  # Optional read replica; empty means reads use the primary
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
 
 
 @dataclass
@@ -230,6 +234,10 @@ class BaseConfig:
         
         # Database
         self.database.url = os.getenv('DATABASE_URL', self.database.url)
+        self.database.replica_url = os.getenv('DATABASE_REPLICA_URL', self.database.replica_url)
+        self.database.pool_size = int(os.getenv('DATABASE_POOL_SIZE', str(self.database.pool_size)))
+        self.database.max_overflow = int(os.getenv('DATABASE_MAX_OVERFLOW', str(self.database.max_overflow)))
+        self.database.pool_recycle = int(os.getenv('DATABASE_POOL_RECYCLE', str(self.database.pool_recycle)))
         
         # Email
         self.email.smtp_server = os.getenv('SMTP_SERVER', self.email.smtp_server)
@@ -358,6 +366,22 @@ class BaseConfig:
     def DATABASE_URL(self):
         return self.database.url
     
+    @property
+    def DATABASE_REPLICA_URL(self):
+        return self.database.replica_url
+    
+    @property
+    def DATABASE_POOL_SIZE(self):
+        return self.database.pool_size
+    
+    @property
+    def DATABASE_MAX_OVERFLOW(self):
+        return self.database.max_overflow
+    
+    @property
+    def DATABASE_POOL_RECYCLE(self):
+        return self.database.pool_recycle
+    
     @property
     def SECRET_KEY(self):
         return self.security.secret_key
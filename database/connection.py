@@ -10,6 +10,15 @@ from .models import Base, CompanySettings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Server databases share a process-wide pool so each session reuses an
+# authenticated connection instead of reconnecting per call
+_POOL_OPTIONS = {
+    'pool_size': config.DATABASE_POOL_SIZE,
+    'max_overflow': config.DATABASE_MAX_OVERFLOW,
+    'pool_pre_ping': True,  # Drop connections the server has closed
+    'pool_recycle': config.DATABASE_POOL_RECYCLE,
+}
+
 # Create engine with SQLite-specific configuration
 if config.DATABASE_URL.startswith('sqlite'):
     engine = create_engine(
@@ -21,13 +30,28 @@ if config.DATABASE_URL.startswith('sqlite'):
 else:
     engine = create_engine(
         config.DATABASE_URL,
-        poolclass=NullPool,  # Disable connection pooling for Streamlit
-        echo=config.DEBUG  # Log SQL queries in debug mode
+        echo=config.DEBUG,  # Log SQL queries in debug mode
+        **_POOL_OPTIONS
+    )
+
+# Optional read replica for read-only queries; falls back to the primary
+if config.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        config.DATABASE_REPLICA_URL,
+        echo=config.DEBUG,  # Log SQL queries in debug mode
+        **_POOL_OPTIONS
     )
+else:
+    replica_engine = engine
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only sessions keep loaded objects usable after the session closes
+ReadOnlySessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=replica_engine, expire_on_commit=False
+)
+
 def init_database():
     """Initialize the database by creating all tables"""
     try:
@@ -50,7 +74,7 @@ def drop_all_tables():
 
 @contextmanager
 def get_db_session():
-    """Context manager for database sessions"""
+    """Context manager for database sessions; the connection goes back to the pool on exit"""
     session = SessionLocal()
     try:
         yield session
@@ -62,6 +86,18 @@ def get_db_session():
     finally:
         session.close()
 
+@contextmanager
+def get_db_session_ro():
+    """Context manager for read-only sessions, routed to the read replica when configured"""
+    session = ReadOnlySessionLocal()
+    try:
+        yield session
+    except Exception as e:
+        logger.error(f"Read-only database session error: {str(e)}")
+        raise
+    finally:
+        session.close()
+
 def get_db():
     """Dependency for FastAPI/other frameworks to get DB session"""
     db = SessionLocal()
@@ -0,0 +1,60 @@
+"""
+Database migration to create the indexes declared on the models for existing databases
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import inspect
+from database.connection import engine
+from database.models import Base
+import logging
+
+logger = logging.getLogger(__name__)
+
+def add_performance_indexes():
+    """
+    Create any model-declared index that is missing from the database.
+    New databases get these from create_all(); this brings older ones up to date.
+    """
+    try:
+        # PostgreSQL builds indexes concurrently so live tables stay writable,
+        # which cannot run inside a transaction block
+        postgres = engine.dialect.name == 'postgresql'
+        if postgres:
+            connection = engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+        else:
+            connection = engine.begin()
+        
+        with connection as conn:
+            existing_tables = set(inspect(conn).get_table_names())
+            
+            for table in Base.metadata.sorted_tables:
+                # Tables that do not exist yet get their indexes from create_all()
+                if table.name not in existing_tables:
+                    continue
+                
+                for index in table.indexes:
+                    if postgres:
+                        index.dialect_options['postgresql']['concurrently'] = True
+                    index.create(bind=conn, checkfirst=True)
+                    logger.info(f"Index {index.name} on {table.name} is in place")
+        
+        logger.info("Migration completed successfully")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to add performance indexes: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    # Run the migration
+    success = add_performance_indexes()
+    if success:
+        print("✅ Migration completed successfully")
+    else:
+        print("❌ Migration failed")
+        exit(1)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, Float, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, Float, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -86,6 +86,7 @@ class Employee(Base):
     offboarding_checklist = relationship("OffboardingChecklist", back_populates="employee", uselist=False, cascade="all, delete-orphan")
     email_logs = relationship("EmailLog", back_populates="employee", cascade="all, delete-orphan")
     system_access = relationship("SystemAccess", back_populates="employee", cascade="all, delete-orphan")
+    scheduled_revocations = relationship("ScheduledRevocation", back_populates="employee", cascade="all, delete-orphan")
 
     @property
     def full_name(self):
@@ -94,7 +95,9 @@ class Employee(Base):
             return f"{self.first_name} {self.last_name}".strip()
         else:
             return self.first_name.strip() if self.first_name else ""
-    assets = relationship("Asset", back_populates="employee", cascade="all, delete-orphan")
+
+    # Ordered so handover forms keep listing assets in the order they were issued
+    assets = relationship("Asset", back_populates="employee", cascade="all, delete-orphan", order_by="Asset.id")
     
     def __repr__(self):
         return f"<Employee(id={self.id}, name={self.full_name}, employee_id={self.employee_id})>"
@@ -162,7 +165,7 @@ class OffboardingChecklist(Base):
     __tablename__ = 'offboarding_checklist'
     
     id = Column(Integer, primary_key=True)
-    employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
+    employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False, unique=True, index=True)  # One exit per employee
     
     # Exit details
     resignation_date = Column(Date)
@@ -191,12 +194,28 @@ class OffboardingChecklist(Base):
     # Notes
     notes = Column(Text)
     
-    # Relationship
+    # Relationships
     employee = relationship("Employee", back_populates="offboarding_checklist")
+    note_entries = relationship("OffboardingNote", back_populates="checklist", cascade="all, delete-orphan", order_by="OffboardingNote.id")
     
     def __repr__(self):
         return f"<OffboardingChecklist(id={self.id}, employee_id={self.employee_id}, completed={self.offboarding_completed})>"
 
+class OffboardingNote(Base):
+    __tablename__ = 'offboarding_notes'
+    
+    id = Column(Integer, primary_key=True)
+    checklist_id = Column(Integer, ForeignKey('offboarding_checklist.id'), nullable=False, index=True)
+    kind = Column(String(50), nullable=False)  # knowledge_transfer_plan, knowledge_transfer
+    body = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=func.now())
+    
+    # Relationship
+    checklist = relationship("OffboardingChecklist", back_populates="note_entries")
+    
+    def __repr__(self):
+        return f"<OffboardingNote(id={self.id}, kind={self.kind}, checklist_id={self.checklist_id})>"
+
 class EmailLog(Base):
     __tablename__ = 'email_logs'
     
@@ -221,6 +240,10 @@ class EmailLog(Base):
 
 class SystemAccess(Base):
     __tablename__ = 'system_access'
+    __table_args__ = (
+        # Covers the per-employee active/revoked access lookups during offboarding
+        Index('ix_sysaccess_emp_granted_revoked', 'employee_id', 'access_granted', 'revoked_at'),
+    )
     
     id = Column(Integer, primary_key=True)
     employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
@@ -239,8 +262,31 @@ class SystemAccess(Base):
     def __repr__(self):
         return f"<SystemAccess(id={self.id}, system={self.system_name}, employee_id={self.employee_id})>"
 
+class ScheduledRevocation(Base):
+    __tablename__ = 'scheduled_revocations'
+    __table_args__ = (
+        Index('ix_sched_rev_date', 'revocation_date'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
+    revocation_date = Column(Date, nullable=False)
+    scheduled_by = Column(String(200))
+    scheduled_at = Column(DateTime, default=func.now())
+    executed_at = Column(DateTime)  # Set once the revocation has run
+    
+    # Relationship
+    employee = relationship("Employee", back_populates="scheduled_revocations")
+    
+    def __repr__(self):
+        return f"<ScheduledRevocation(id={self.id}, employee_id={self.employee_id}, date={self.revocation_date})>"
+
 class Asset(Base):
     __tablename__ = 'assets'
+    __table_args__ = (
+        # Covers the per-employee asset lookups and pending-return checks
+        Index('ix_asset_emp_status', 'employee_id', 'return_status'),
+    )
     
     id = Column(Integer, primary_key=True)
     employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
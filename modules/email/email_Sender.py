@@ -1,5 +1,9 @@
 import smtplib
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -14,6 +18,22 @@ from database.models import EmailTemplate, EmailLog
 
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP connections are reused across sends to skip the
+# connect/STARTTLS/AUTH handshake; idle ones are dropped before servers time them out
+SMTP_POOL_SIZE = 4
+SMTP_IDLE_TIMEOUT_SECONDS = 60
+
+# Reconnect attempts for a send whose connection drops mid-batch
+SMTP_SEND_ATTEMPTS = 3
+SMTP_RETRY_BACKOFF_SECONDS = 1
+_smtp_pool: "queue.Queue" = queue.Queue(maxsize=SMTP_POOL_SIZE)
+
+
+class _SMTPHold(threading.local):
+    """Per-thread connection kept checked out by smtp_connection()"""
+    holding = False
+    server: Optional[smtplib.SMTP] = None
+
 class EmailSender:
     """Email sending functionality"""
     
@@ -25,6 +45,10 @@ class EmailSender:
         self.use_tls = config.email.smtp_use_tls
         self.default_sender = config.email.default_sender_email
         self.default_sender_name = config.email.default_sender_name
+        
+        # Connection held for the duration of a smtp_connection() block; kept
+        # per thread so background senders sharing this instance do not mix sessions
+        self._smtp_hold = _SMTPHold()
 
         # Initialize Jinja2 environment for templates
         template_folder = getattr(config, 'EMAIL_TEMPLATE_FOLDER', 'templates/email')
@@ -193,16 +217,6 @@ class EmailSender:
     def _send_via_smtp(self, msg: MIMEMultipart, email_data: Dict[str, Any]) -> Dict[str, Any]:
         """Send email via SMTP"""
         try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            
-            if self.use_tls:
-                server.starttls()
-            
-            # Login if credentials provided
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
-            
             # Get all recipients
             recipients = [email_data['to_email']]
             if 'cc_emails' in email_data and email_data['cc_emails']:
@@ -212,9 +226,28 @@ class EmailSender:
                 else:
                     recipients.extend(cc_emails)
             
-            # Send email
-            server.send_message(msg, self.default_sender, recipients)
-            server.quit()
+            # Send email over a pooled connection
+            server = self._checkout_smtp_connection()
+            try:
+                for attempt in range(SMTP_SEND_ATTEMPTS):
+                    try:
+                        server.send_message(msg, self.default_sender, recipients)
+                        break
+                    except smtplib.SMTPServerDisconnected:
+                        self._close_smtp_connection(server)
+                        if attempt + 1 == SMTP_SEND_ATTEMPTS:
+                            raise
+                        # A stale pooled connection is replaced straight away;
+                        # repeated disconnects back off before reconnecting
+                        if attempt:
+                            time.sleep(SMTP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                        server = self._open_smtp_connection()
+            except Exception:
+                self._close_smtp_connection(server)
+                self._smtp_hold.server = None
+                raise
+            
+            self._release_smtp_connection(server)
             
             logger.info(f"Email sent successfully to {email_data['to_email']}")
             
@@ -230,6 +263,72 @@ class EmailSender:
                 'message': f'SMTP error: {str(e)}'
             }
     
+    def _open_smtp_connection(self) -> smtplib.SMTP:
+        """Connect, upgrade to TLS and authenticate a new SMTP connection"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        
+        if self.use_tls:
+            server.starttls()
+        
+        # Login if credentials provided
+        if self.smtp_username and self.smtp_password:
+            server.login(self.smtp_username, self.smtp_password)
+        
+        return server
+    
+    @contextmanager
+    def smtp_connection(self):
+        """
+        Keep a single SMTP connection checked out across a batch of sends
+
+        Yields:
+            This sender; send_email calls inside the block reuse one connection
+        """
+        hold = self._smtp_hold
+        hold.holding = True
+        try:
+            yield self
+        finally:
+            hold.holding = False
+            server, hold.server = hold.server, None
+            if server is not None:
+                self._release_smtp_connection(server)
+    
+    def _checkout_smtp_connection(self) -> smtplib.SMTP:
+        """Take a recently used connection from the pool or open a new one"""
+        if self._smtp_hold.server is not None:
+            return self._smtp_hold.server
+        
+        while True:
+            try:
+                server, last_used = _smtp_pool.get_nowait()
+            except queue.Empty:
+                return self._open_smtp_connection()
+            
+            if time.monotonic() - last_used < SMTP_IDLE_TIMEOUT_SECONDS:
+                return server
+            
+            self._close_smtp_connection(server)
+    
+    def _release_smtp_connection(self, server: smtplib.SMTP):
+        """Return a healthy connection to the pool, closing it if the pool is full"""
+        if self._smtp_hold.holding:
+            self._smtp_hold.server = server
+            return
+        
+        try:
+            _smtp_pool.put_nowait((server, time.monotonic()))
+        except queue.Full:
+            self._close_smtp_connection(server)
+    
+    @staticmethod
+    def _close_smtp_connection(server: smtplib.SMTP):
+        """Close an SMTP connection, ignoring errors from dead sockets"""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
     def _send_via_sendgrid(self, email_data: Dict[str, Any]) -> Dict[str, Any]:
         """Send email via SendGrid API"""
         try:
@@ -306,33 +405,36 @@ class EmailSender:
             logger.error(f"Error attaching company logo: {str(e)}")
 
     def _attach_file(self, msg: MIMEMultipart, attachment: Dict[str, Any]):
-        """Attach a file to the email"""
+        """Attach a file to the email, from 'file_bytes' when given instead of reading 'file_path'"""
         try:
-            file_path = attachment['file_path']
-            file_name = attachment.get('file_name', os.path.basename(file_path))
-
-            with open(file_path, 'rb') as file:
-                # Determine MIME type based on file extension
-                if file_name.lower().endswith('.pdf'):
-                    part = MIMEBase('application', 'pdf')
-                elif file_name.lower().endswith(('.jpg', '.jpeg')):
-                    part = MIMEBase('image', 'jpeg')
-                elif file_name.lower().endswith('.png'):
-                    part = MIMEBase('image', 'png')
-                elif file_name.lower().endswith('.doc'):
-                    part = MIMEBase('application', 'msword')
-                elif file_name.lower().endswith('.docx'):
-                    part = MIMEBase('application', 'vnd.openxmlformats-officedocument.wordprocessingml.document')
-                else:
-                    part = MIMEBase('application', 'octet-stream')
+            file_name = attachment.get('file_name') or os.path.basename(attachment['file_path'])
 
-                part.set_payload(file.read())
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename= {file_name}'
-                )
-                msg.attach(part)
+            file_bytes = attachment.get('file_bytes')
+            if file_bytes is None:
+                with open(attachment['file_path'], 'rb') as file:
+                    file_bytes = file.read()
+
+            # Determine MIME type based on file extension
+            if file_name.lower().endswith('.pdf'):
+                part = MIMEBase('application', 'pdf')
+            elif file_name.lower().endswith(('.jpg', '.jpeg')):
+                part = MIMEBase('image', 'jpeg')
+            elif file_name.lower().endswith('.png'):
+                part = MIMEBase('image', 'png')
+            elif file_name.lower().endswith('.doc'):
+                part = MIMEBase('application', 'msword')
+            elif file_name.lower().endswith('.docx'):
+                part = MIMEBase('application', 'vnd.openxmlformats-officedocument.wordprocessingml.document')
+            else:
+                part = MIMEBase('application', 'octet-stream')
+
+            part.set_payload(file_bytes)
+            encoders.encode_base64(part)
+            part.add_header(
+                'Content-Disposition',
+                f'attachment; filename= {file_name}'
+            )
+            msg.attach(part)
 
         except Exception as e:
             logger.error(f"Error attaching file: {str(e)}")
@@ -358,38 +460,40 @@ class EmailSender:
             'details': []
         }
         
-        for recipient in recipients:
-            try:
-                # Merge recipient data with template
-                email_data = {
-                    'to_email': recipient['email'],
-                    'template_name': email_template['template_name'],
-                    'template_variables': {
-                        **email_template.get('template_variables', {}),
-                        **recipient.get('variables', {})
+        # Share one SMTP connection across the whole batch
+        with self.smtp_connection():
+            for recipient in recipients:
+                try:
+                    # Merge recipient data with template
+                    email_data = {
+                        'to_email': recipient['email'],
+                        'template_name': email_template['template_name'],
+                        'template_variables': {
+                            **email_template.get('template_variables', {}),
+                            **recipient.get('variables', {})
+                        }
                     }
-                }
-                
-                result = self.send_templated_email(email_data)
-                
-                if result['success']:
-                    results['sent'] += 1
-                else:
+                    
+                    result = self.send_templated_email(email_data)
+                    
+                    if result['success']:
+                        results['sent'] += 1
+                    else:
+                        results['failed'] += 1
+                    
+                    results['details'].append({
+                        'email': recipient['email'],
+                        'success': result['success'],
+                        'message': result.get('message', '')
+                    })
+                    
+                except Exception as e:
                     results['failed'] += 1
-                
-                results['details'].append({
-                    'email': recipient['email'],
-                    'success': result['success'],
-                    'message': result.get('message', '')
-                })
-                
-            except Exception as e:
-                results['failed'] += 1
-                results['details'].append({
-                    'email': recipient['email'],
-                    'success': False,
-                    'message': str(e)
-                })
+                    results['details'].append({
+                        'email': recipient['email'],
+                        'success': False,
+                        'message': str(e)
+                    })
         
         return results
     
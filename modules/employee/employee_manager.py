@@ -10,6 +10,7 @@ from database.models import (
     EmployeeStatus, EmployeeType
 )
 from modules.email.email_Sender import EmailSender
+from modules.offboarding.exit_initiation import invalidate_exit_status
 from config import config
 
 logger = logging.getLogger(__name__)
@@ -272,6 +273,7 @@ class EmployeeManager:
                         checklist.completed_at = datetime.utcnow()
                 
                 session.commit()
+                invalidate_exit_status(employee_id)
                 
                 logger.info(f"Employee status updated: {employee.employee_id} - {new_status}")
                 
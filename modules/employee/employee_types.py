@@ -1,8 +1,7 @@
 from enum import Enum
+from sys import intern
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from datetime import date
-from config import config
 
 class EmployeeTypeEnum(Enum):
     """Employee type enumeration"""
@@ -29,6 +28,10 @@ class EmployeeTypeConfig:
     min_tenure_months: Optional[int] = None
     max_tenure_months: Optional[int] = None
 
+def _interned(items: List[str]) -> List[str]:
+    """Intern repeated document/system names so all configs share one object"""
+    return [intern(item) for item in items]
+
 class EmployeeTypes:
     """Employee type definitions and configurations"""
     
@@ -44,7 +47,7 @@ class EmployeeTypes:
             has_gratuity=True,
             has_medical_insurance=True,
             has_leave_benefits=True,
-            required_documents=[
+            required_documents=_interned([
                 '10th Certificate',
                 '12th Certificate',
                 'Graduation Certificate',
@@ -58,8 +61,8 @@ class EmployeeTypes:
                 'Previous Employment - Last 3 Salary Slips',
                 'Previous Employment - Experience Letter',
                 'Passport Size Photograph'
-            ],
-            systems_access=['Gmail', 'Slack', 'TeamLogger', 'Google Drive', 'Jira'],
+            ]),
+            systems_access=_interned(['Gmail', 'Slack', 'TeamLogger', 'Google Drive', 'Jira']),
             compensation_type='salary',
             bgv_required=True
         ),
@@ -74,7 +77,7 @@ class EmployeeTypes:
             has_gratuity=False,
             has_medical_insurance=False,
             has_leave_benefits=False,
-            required_documents=[
+            required_documents=_interned([
                 '10th Certificate',
                 '12th Certificate',
                 'Graduation Certificate',
@@ -82,8 +85,8 @@ class EmployeeTypes:
                 'Aadhaar Card',
                 'PAN Card',
                 'Passport Size Photograph'
-            ],
-            systems_access=['Gmail', 'Slack'],
+            ]),
+            systems_access=_interned(['Gmail', 'Slack']),
             compensation_type='stipend',
             bgv_required=False,
             min_tenure_months=3,
@@ -100,14 +103,14 @@ class EmployeeTypes:
             has_gratuity=False,
             has_medical_insurance=False,
             has_leave_benefits=False,
-            required_documents=[
+            required_documents=_interned([
                 'Aadhaar Card',
                 'PAN Card',
                 'GST Certificate (if applicable)',
                 'Previous Work Samples',
                 'Passport Size Photograph'
-            ],
-            systems_access=['Gmail', 'Slack', 'TeamLogger'],
+            ]),
+            systems_access=_interned(['Gmail', 'Slack', 'TeamLogger']),
             compensation_type='hourly',
             bgv_required=False
         )
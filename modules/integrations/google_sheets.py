@@ -3,9 +3,17 @@ Google Sheets Integration Module
 Handles reading and syncing employee data from Google Sheets
 """
 
+import re
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from sqlalchemy.exc import SQLAlchemyError
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import streamlit as st
@@ -14,6 +22,26 @@ from config import config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace in manager names, replaced by dots in generated emails
+_WHITESPACE = re.compile(r'\s+')
+
+# Records per database transaction, and concurrent transactions, in sync_to_database
+SYNC_CHUNK_SIZE = 500
+SYNC_MAX_WORKERS = 4
+
+# Matches the refresh time promised in get_sheets_add_instructions
+CACHE_TTL_SECONDS = 300
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _fetch_cached(_integration: 'GoogleSheetsIntegration', csv_url: str) -> pd.DataFrame:
+    """Download the sheet at most once per TTL window; errors propagate so they are not cached"""
+    return _integration._download_employee_data()
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _process_cached(_integration: 'GoogleSheetsIntegration', df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Process each distinct sheet snapshot at most once per TTL window"""
+    return _integration._process_employee_frame(df)
+
 class GoogleSheetsIntegration:
     """Google Sheets integration for employee data"""
     
@@ -33,6 +61,37 @@ class GoogleSheetsIntegration:
             'Department': 'department',
             'Categories': 'employee_type'
         }
+
+        # Optional columns that are already named after database fields
+        self.special_fields = ['date_of_joining', 'ctc']
+
+        # Parse every column as pandas strings, low-cardinality ones as categories
+        self.read_dtypes = defaultdict(lambda: 'string', {
+            'Department': 'category',
+            'Categories': 'category'
+        })
+
+        # Shared HTTP session so repeated syncs reuse the keep-alive TLS connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+
+        # Validators and parsed data from the last download, for conditional GETs
+        self._etag = None
+        self._last_modified = None
+        self._cached_df = None
+
+        # Employee model column names, resolved on first sync
+        self._employee_columns = None
+
+        # Whether the last download was answered with 304 Not Modified, and the
+        # result of the last successful full_sync with the sheet version it covered
+        self._not_modified = False
+        self._last_sync_result = None
+        self._synced_version = None
     
     def fetch_employee_data(self) -> Optional[pd.DataFrame]:
         """
@@ -42,22 +101,71 @@ class GoogleSheetsIntegration:
             DataFrame with employee data or None if failed
         """
         try:
-            logger.info(f"Fetching data from Google Sheets: {self.csv_url}")
-
-            # Read CSV data from Google Sheets
-            df = pd.read_csv(self.csv_url)
-
-            logger.info(f"Successfully fetched {len(df)} rows from Google Sheets")
-            return df
+            return _fetch_cached(self, self.csv_url)
             
         except Exception as e:
             logger.error(f"Error fetching data from Google Sheets: {str(e)}")
             return None
+
+    def _download_employee_data(self) -> pd.DataFrame:
+        """
+        Download the sheet CSV, revalidating against the last download
+
+        Returns:
+            DataFrame with employee data
+        """
+        logger.info(f"Fetching data from Google Sheets: {self.csv_url}")
+
+        # Only download the sheet again if it changed since the last fetch
+        headers = {}
+        if self._cached_df is not None:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+        # Stream the CSV from the shared session straight into the parser;
+        # leaving the block releases the connection back to the pool
+        with self.session.get(self.csv_url, headers=headers, stream=True, timeout=30) as response:
+            self._not_modified = response.status_code == 304
+            if self._not_modified:
+                logger.info("Google Sheets data not modified, using cached data")
+                return self._cached_df.copy()
+
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            # Only parse the columns we map; headers may carry stray whitespace
+            sheet_columns = set(self.column_mapping) | set(self.special_fields)
+            df = pd.read_csv(
+                response.raw,
+                usecols=lambda column: column.strip() in sheet_columns,
+                dtype=self.read_dtypes
+            )
+
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        self._cached_df = df.copy()
+
+        logger.info(f"Successfully fetched {len(df)} rows from Google Sheets")
+        return df
     
     def process_employee_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Process and clean employee data from Google Sheets
         
+        Args:
+            df: Raw DataFrame from Google Sheets
+            
+        Returns:
+            List of processed employee records
+        """
+        return _process_cached(self, df)
+
+    def _process_employee_frame(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Uncached implementation of process_employee_data
+        
         Args:
             df: Raw DataFrame from Google Sheets
             
@@ -65,65 +173,43 @@ class GoogleSheetsIntegration:
             List of processed employee records
         """
         processed_employees = []
+
+        # One timestamp per run, shared by generated IDs and last_synced
+        synced_at = datetime.now()
         
         try:
-            # Clean column names (remove extra spaces, etc.)
+            # Clean column names (remove extra spaces, etc.) and map them to our database fields
             df.columns = df.columns.str.strip()
-            
-            for index, row in df.iterrows():
-                try:
-                    # Skip empty rows
-                    first_name = row.get('First Name', '')
-                    last_name = row.get('Last Name', '')
-                    if pd.isna(first_name) or str(first_name).strip() == '':
-                        continue
+            df = df.rename(columns=self.column_mapping)
+            fields = [
+                field for field in list(self.column_mapping.values()) + self.special_fields
+                if field in df.columns
+            ]
+            if 'first_name' not in fields:
+                logger.warning("No 'First Name' column found in Google Sheets data")
+                return processed_employees
+            df = df[fields]
+
+            # Strip text values once for the whole frame; blank cells become missing
+            text_columns = df.select_dtypes(include=['object', 'string', 'category']).columns
+            df = df.assign(**{column: self._strip_text(df[column]) for column in text_columns})
+
+            # Skip empty rows - blank first names are already missing values
+            df = df.dropna(subset=['first_name'])
+
+            # Convert special fields column-wise before touching individual rows
+            df = self._vectorize_frame(df, synced_at)
+
+            # Build the records in one go; a single frame-wide mask turns every
+            # missing value (NA, NaN, NaT) into None
+            present = df.notna()
+            processed_employees = df.astype(object).where(present, None).to_dict(orient='records')
+
+            # Add metadata
+            for employee_data in processed_employees:
+                employee_data['data_source'] = 'google_sheets'
+                employee_data['last_synced'] = synced_at
 
-                    # Process each employee record
-                    employee_data = {}
-
-                    # Map columns to our database fields
-                    for sheet_col, db_field in self.column_mapping.items():
-                        if sheet_col in df.columns:
-                            value = row.get(sheet_col, '')
-
-                            # Clean and process the value
-                            if pd.isna(value):
-                                value = None
-                            elif isinstance(value, str):
-                                value = value.strip()
-                                if value == '':
-                                    value = None
-
-                            employee_data[db_field] = value
-
-                    # Ensure first_name and last_name are properly set
-                    # Handle missing last names naturally - leave empty if not provided
-                    if not employee_data.get('last_name') or employee_data.get('last_name') in [None, '', 'None']:
-                        employee_data['last_name'] = ''
-
-                    # Process specific fields
-                    employee_data = self._process_special_fields(employee_data)
-
-                    # Create full_name field
-                    first_name = employee_data.get('first_name', '').strip()
-                    last_name = employee_data.get('last_name', '').strip()
-                    if first_name and last_name:
-                        employee_data['full_name'] = f"{first_name} {last_name}"
-                    elif first_name:
-                        employee_data['full_name'] = first_name
-                    else:
-                        employee_data['full_name'] = 'Unknown'
-
-                    # Add metadata
-                    employee_data['data_source'] = 'google_sheets'
-                    employee_data['last_synced'] = datetime.now()
-
-                    processed_employees.append(employee_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing row {index}: {str(e)}")
-                    continue
-            
             logger.info(f"Successfully processed {len(processed_employees)} employee records")
             return processed_employees
             
@@ -131,82 +217,83 @@ class GoogleSheetsIntegration:
             logger.error(f"Error processing employee data: {str(e)}")
             return []
     
-    def _process_special_fields(self, employee_data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _strip_text(column: pd.Series) -> pd.Series:
+        """Strip whitespace from a text column and turn blank cells into missing values"""
+        stripped = column.astype('string').str.strip().replace('', pd.NA)
+        return stripped.astype('category') if isinstance(column.dtype, pd.CategoricalDtype) else stripped
+
+    def _vectorize_frame(self, df: pd.DataFrame, synced_at: datetime) -> pd.DataFrame:
         """
-        Process special fields that need formatting or conversion
-        
+        Convert special fields and derive names/IDs for the whole DataFrame at once
+
         Args:
-            employee_data: Raw employee data dictionary
-            
+            df: DataFrame with columns already mapped to database fields
+            synced_at: Timestamp of the current processing run
+
         Returns:
-            Processed employee data dictionary
+            DataFrame with converted columns
         """
-        # Process date of joining
-        if employee_data.get('date_of_joining'):
-            try:
-                # Try different date formats
-                date_str = str(employee_data['date_of_joining'])
-                for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y']:
-                    try:
-                        employee_data['date_of_joining'] = datetime.strptime(date_str, date_format).date()
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # If no format matches, set to None
-                    employee_data['date_of_joining'] = None
-                    logger.warning(f"Could not parse date: {date_str}")
-            except Exception as e:
-                employee_data['date_of_joining'] = None
-                logger.warning(f"Error processing date of joining: {str(e)}")
-        
+        # Process date of joining - try each format in order, first match wins
+        if 'date_of_joining' in df.columns:
+            date_strs = df['date_of_joining'].astype('string')
+            parsed = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+            for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y']:
+                parsed = parsed.fillna(pd.to_datetime(date_strs, format=date_format, errors='coerce'))
+
+            unparsed = date_strs.notna() & parsed.isna()
+            if unparsed.any():
+                logger.warning(f"Could not parse {int(unparsed.sum())} date(s) of joining")
+
+            df = df.assign(date_of_joining=parsed.dt.date)
+
         # Process CTC (remove currency symbols, commas)
-        if employee_data.get('ctc'):
-            try:
-                ctc_str = str(employee_data['ctc'])
-                # Remove currency symbols and commas
-                ctc_str = ctc_str.replace('₹', '').replace(',', '').replace('$', '').strip()
-                if ctc_str and ctc_str.replace('.', '').isdigit():
-                    employee_data['ctc'] = float(ctc_str)
-                else:
-                    employee_data['ctc'] = None
-            except Exception as e:
-                employee_data['ctc'] = None
-                logger.warning(f"Error processing CTC: {str(e)}")
-        
+        if 'ctc' in df.columns:
+            ctc_strs = df['ctc'].astype('string').str.replace(r'[₹,$]', '', regex=True).str.strip()
+            is_amount = ctc_strs.str.fullmatch(r'[\d.]+').fillna(False).astype(bool)
+            df = df.assign(ctc=pd.to_numeric(ctc_strs.where(is_amount), errors='coerce').astype('float64'))
+
         # Process employee type from Categories column
-        if employee_data.get('employee_type'):
-            emp_type = str(employee_data['employee_type']).lower().strip()
-            if 'intern' in emp_type:
-                employee_data['employee_type'] = 'intern'
-            elif 'contract' in emp_type:
-                employee_data['employee_type'] = 'contractor'
-            elif 'full' in emp_type or 'permanent' in emp_type:
-                employee_data['employee_type'] = 'full_time'
-            else:
-                employee_data['employee_type'] = 'full_time'  # Default
+        if 'employee_type' in df.columns:
+            categories = df['employee_type'].astype('string').str.lower()
+            df = df.assign(employee_type=pd.Categorical(np.select(
+                [
+                    categories.str.contains('intern', regex=False).fillna(False).astype(bool),
+                    categories.str.contains('contract', regex=False).fillna(False).astype(bool),
+                ],
+                ['intern', 'contractor'],
+                default='full_time'  # Full time, permanent and anything unrecognised
+            )))
         else:
-            employee_data['employee_type'] = 'full_time'  # Default
+            df = df.assign(employee_type='full_time')  # Default
 
         # Set default status as active (since no status column in your sheet)
-        employee_data['status'] = 'active'
-        
-        # Generate employee ID if not present
-        if not employee_data.get('employee_id'):
-            # Generate a simple ID based on name
-            first_name = employee_data.get('first_name', '')
-            last_name = employee_data.get('last_name', '')
-            if first_name and last_name:
-                # Take first letter of first name and last name
-                initials = first_name[0] + last_name[0]
-                employee_data['employee_id'] = f"RI{initials.upper()}{datetime.now().strftime('%m%d')}"
-            elif first_name:
-                employee_data['employee_id'] = f"RI{first_name[:2].upper()}{datetime.now().strftime('%m%d')}"
-            else:
-                employee_data['employee_id'] = f"RIUNK{datetime.now().strftime('%m%d')}"
-        
-        return employee_data
-    
+        df = df.assign(status='active')
+
+        # Handle missing last names naturally - leave empty if not provided
+        first_names = df['first_name'].astype('string').fillna('')
+        if 'last_name' in df.columns:
+            last_names = df['last_name'].astype('string').fillna('')
+            last_names = last_names.mask(last_names == 'None', '')
+        else:
+            last_names = pd.Series('', index=df.index, dtype='string')
+
+        # Create full_name field from the cleaned names
+        full_names = (first_names + ' ' + last_names).str.strip()
+        df = df.assign(last_name=last_names, full_name=full_names.mask(full_names == '', 'Unknown'))
+
+        # Generate employee ID if not present - initials of first and last name,
+        # or the first two letters of a lone first name
+        initials = (first_names.str[:1] + last_names.str[:1]).where(last_names != '', first_names.str[:2])
+        initials = initials.str.upper().mask(first_names == '', 'UNK')
+        generated_ids = 'RI' + initials + synced_at.strftime('%m%d')
+        if 'employee_id' in df.columns:
+            df = df.assign(employee_id=df['employee_id'].where(df['employee_id'].notna(), generated_ids))
+        else:
+            df = df.assign(employee_id=generated_ids)
+
+        return df
+
     def sync_to_database(self, employee_records: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Sync employee records to the database
@@ -217,7 +304,6 @@ class GoogleSheetsIntegration:
         Returns:
             Dictionary with sync statistics
         """
-        from database.connection import get_db_session
         from database.models import Employee
         
         stats = {
@@ -226,79 +312,195 @@ class GoogleSheetsIntegration:
             'updated': 0,
             'errors': 0
         }
+
+        # Metadata such as data_source, last_synced and full_name are not columns
+        if self._employee_columns is None:
+            self._employee_columns = frozenset(column.name for column in Employee.__table__.columns)
+
+        # Each chunk runs in its own session and transaction; SQLite serializes
+        # writers anyway, so only fan out on server databases
+        chunks = [
+            employee_records[start:start + SYNC_CHUNK_SIZE]
+            for start in range(0, len(employee_records), SYNC_CHUNK_SIZE)
+        ]
+        max_workers = 1 if config.DATABASE_URL.startswith('sqlite') else SYNC_MAX_WORKERS
+        missing_email = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = {executor.submit(self._sync_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    chunk_stats = future.result()
+                except Exception as e:
+                    logger.error(f"Error during database sync: {str(e)}")
+                    stats['errors'] += len(futures[future])
+                    continue
+
+                missing_email += chunk_stats.pop('missing_email')
+                for key, value in chunk_stats.items():
+                    stats[key] += value
+
+        if missing_email:
+            logger.warning(f"Skipped {missing_email} employee(s) with no email provided")
+        logger.info(f"Sync completed: {json.dumps(stats)}")
         
-        try:
-            with get_db_session() as session:
-                for record in employee_records:
-                    try:
-                        # Check if employee already exists
-                        existing_employee = None
-                        
-                        # Try to find by employee_id first
-                        if record.get('employee_id'):
-                            existing_employee = session.query(Employee).filter_by(
-                                employee_id=record['employee_id']
-                            ).first()
-                        
-                        # If not found, try by email
-                        if not existing_employee and record.get('email'):
-                            existing_employee = session.query(Employee).filter_by(
-                                email=record['email']
-                            ).first()
-
-                        # If still not found, try by first_name and last_name combination
-                        if not existing_employee and record.get('first_name') and record.get('last_name'):
-                            existing_employee = session.query(Employee).filter_by(
-                                first_name=record['first_name'],
-                                last_name=record['last_name']
-                            ).first()
-                        
-                        # Filter record to only include fields that exist in the Employee model
-                        excluded_fields = ['data_source', 'last_synced', 'full_name']
-                        valid_fields = {}
-                        for key, value in record.items():
-                            if hasattr(Employee, key) and key not in excluded_fields:
-                                valid_fields[key] = value
-
-                        # Ensure required fields are not None
-                        if not valid_fields.get('first_name'):
-                            valid_fields['first_name'] = 'Unknown'
-                        # Allow empty last_name - set to empty string if None
-                        if valid_fields.get('last_name') is None:
-                            valid_fields['last_name'] = ''
-                        if not valid_fields.get('email'):
-                            stats['errors'] += 1
-                            logger.error(f"Skipping employee {valid_fields.get('first_name')} - no email provided")
-                            continue
-
-                        if existing_employee:
-                            # Update existing employee
-                            for key, value in valid_fields.items():
-                                if value is not None:
-                                    setattr(existing_employee, key, value)
-                            stats['updated'] += 1
-                            logger.info(f"Updated employee: {record.get('first_name')} {record.get('last_name')}")
-                        else:
-                            # Create new employee
-                            new_employee = Employee(**valid_fields)
-                            session.add(new_employee)
-                            stats['created'] += 1
-                            logger.info(f"Created employee: {record.get('first_name')} {record.get('last_name')}")
-                        
-                    except Exception as e:
+        return stats
+
+    def _sync_chunk(self, employee_records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Sync one chunk of employee records in its own session
+        
+        Args:
+            employee_records: Chunk of processed employee records
+            
+        Returns:
+            Dictionary with created/updated/errors/missing_email counts for the chunk
+        """
+        from database.connection import get_db_session
+        from database.models import Employee
+
+        stats = {
+            'created': 0,
+            'updated': 0,
+            'errors': 0,
+            'missing_email': 0
+        }
+        employee_columns = self._employee_columns
+
+        # Per-record detail only at DEBUG; sync_to_database logs the summary
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        with get_db_session() as session:
+            # Look up existing employees with one IN query per match key
+            employee_ids = {r['employee_id'] for r in employee_records if r.get('employee_id')}
+            emails = {r['email'] for r in employee_records if r.get('email')}
+            names = {(r['first_name'], r['last_name']) for r in employee_records
+                     if r.get('first_name') and r.get('last_name')}
+
+            by_employee_id = self._index_first(
+                session.query(Employee).filter(Employee.employee_id.in_(employee_ids)).order_by(Employee.id),
+                lambda employee: employee.employee_id
+            ) if employee_ids else {}
+            by_email = self._index_first(
+                session.query(Employee).filter(Employee.email.in_(emails)).order_by(Employee.id),
+                lambda employee: employee.email
+            ) if emails else {}
+            by_name = self._index_first(
+                session.query(Employee).filter(
+                    Employee.first_name.in_({first_name for first_name, _ in names})
+                ).order_by(Employee.id),
+                lambda employee: (employee.first_name, employee.last_name)
+            ) if names else {}
+
+            inserts = []
+            updates = []
+            for record in employee_records:
+                try:
+                    # Check if employee already exists
+                    existing_employee = None
+                    
+                    # Try to find by employee_id first
+                    if record.get('employee_id'):
+                        existing_employee = by_employee_id.get(record['employee_id'])
+                    
+                    # If not found, try by email
+                    if not existing_employee and record.get('email'):
+                        existing_employee = by_email.get(record['email'])
+
+                    # If still not found, try by first_name and last_name combination
+                    if not existing_employee and record.get('first_name') and record.get('last_name'):
+                        existing_employee = by_name.get((record['first_name'], record['last_name']))
+                    
+                    # Filter record to only include fields that exist in the Employee model
+                    valid_fields = {key: value for key, value in record.items() if key in employee_columns}
+
+                    # Ensure required fields are not None
+                    if not valid_fields.get('first_name'):
+                        valid_fields['first_name'] = 'Unknown'
+                    # Allow empty last_name - set to empty string if None
+                    if valid_fields.get('last_name') is None:
+                        valid_fields['last_name'] = ''
+                    if not valid_fields.get('email'):
                         stats['errors'] += 1
-                        logger.error(f"Error syncing employee {record.get('full_name')}: {str(e)}")
+                        stats['missing_email'] += 1
+                        if debug_enabled:
+                            logger.debug(f"Skipping employee {valid_fields.get('first_name')} - no email provided")
                         continue
-                
-                session.commit()
-                logger.info(f"Sync completed: {stats}")
-                
-        except Exception as e:
-            logger.error(f"Error during database sync: {str(e)}")
-            stats['errors'] = stats['total_records']
-        
+
+                    if existing_employee:
+                        # Update existing employee - only overwrite with provided values
+                        update_fields = {key: value for key, value in valid_fields.items() if value is not None}
+                        update_fields['id'] = existing_employee.id
+                        updates.append(update_fields)
+                        if debug_enabled:
+                            logger.debug(f"Updating employee: {record.get('first_name')} {record.get('last_name')}")
+                    else:
+                        # Create new employee
+                        inserts.append(valid_fields)
+                        if debug_enabled:
+                            logger.debug(f"Creating employee: {record.get('first_name')} {record.get('last_name')}")
+                    
+                except Exception as e:
+                    stats['errors'] += 1
+                    logger.error(f"Error syncing employee {record.get('full_name')}: {str(e)}")
+                    continue
+
+            self._bulk_write(session, Employee, inserts, updates, stats)
+
         return stats
-    
+
+    @staticmethod
+    def _bulk_write(session, model, inserts: List[Dict[str, Any]], updates: List[Dict[str, Any]],
+                    stats: Dict[str, int]) -> None:
+        """
+        Write all inserts and updates with bulk mappings, falling back to
+        row-by-row writes so a bad row only counts as a single error
+
+        Args:
+            session: Active database session
+            model: Mapped model class
+            inserts: Column mappings for new rows
+            updates: Column mappings, including primary key, for existing rows
+            stats: Sync statistics to update in place
+        """
+        try:
+            with session.begin_nested():
+                session.bulk_insert_mappings(model, inserts)
+                session.bulk_update_mappings(model, updates)
+            stats['created'] += len(inserts)
+            stats['updated'] += len(updates)
+            return
+        except SQLAlchemyError as e:
+            logger.warning(f"Bulk write failed, retrying row by row: {str(e)}")
+
+        for mappings, write, stat in ((inserts, session.bulk_insert_mappings, 'created'),
+                                      (updates, session.bulk_update_mappings, 'updated')):
+            for mapping in mappings:
+                try:
+                    with session.begin_nested():
+                        write(model, [mapping])
+                    stats[stat] += 1
+                except SQLAlchemyError as e:
+                    stats['errors'] += 1
+                    logger.error(f"Error syncing employee {mapping.get('first_name')}: {str(e)}")
+
+    @staticmethod
+    def _index_first(employees, key) -> Dict[Any, Any]:
+        """
+        Index query results by key, keeping the first match like query.first()
+
+        Args:
+            employees: Iterable of Employee rows ordered by id
+            key: Function returning the index key for an employee
+
+        Returns:
+            Dictionary mapping key to employee
+        """
+        index = {}
+        for employee in employees:
+            index.setdefault(key(employee), employee)
+        return index
+
     def full_sync(self) -> Dict[str, Any]:
         """
         Perform a full sync from Google Sheets to database
@@ -314,11 +516,21 @@ class GoogleSheetsIntegration:
         }
         
         try:
-            # Step 1: Fetch data from Google Sheets
-            df = self.fetch_employee_data()
-            if df is None:
+            # Step 1: Fetch data from Google Sheets - always revalidate with the
+            # server rather than trusting the UI cache
+            try:
+                df = self._download_employee_data()
+            except Exception as e:
+                logger.error(f"Error fetching data from Google Sheets: {str(e)}")
                 result['message'] = "Failed to fetch data from Google Sheets"
                 return result
+
+            # Skip processing and the database entirely if the sheet is unchanged
+            # since the last successful sync
+            sheet_version = (self._etag, self._last_modified)
+            if self._not_modified and self._last_sync_result and self._synced_version == sheet_version:
+                logger.info("Google Sheets unchanged since last sync, skipping")
+                return {**self._last_sync_result, 'message': "No changes since last sync"}
             
             # Step 2: Process the data
             employee_records = self.process_employee_data(df)
@@ -334,6 +546,9 @@ class GoogleSheetsIntegration:
             result['message'] = f"Sync completed successfully. Created: {stats['created']}, Updated: {stats['updated']}, Errors: {stats['errors']}"
             result['stats'] = stats
             result['data_preview'] = employee_records[:5]  # First 5 records for preview
+
+            self._last_sync_result = dict(result)
+            self._synced_version = sheet_version
             
         except Exception as e:
             result['message'] = f"Sync failed: {str(e)}"
@@ -358,13 +573,14 @@ class GoogleSheetsIntegration:
         # Generate employee ID if not provided
         employee_id = employee_data.get('employee_id')
         if not employee_id:
+            mmdd = datetime.now().strftime('%m%d')
             if first_name and last_name:
                 initials = first_name[0] + last_name[0]
-                employee_id = f"RI{initials.upper()}{datetime.now().strftime('%m%d')}"
+                employee_id = f"RI{initials.upper()}{mmdd}"
             elif first_name:
-                employee_id = f"RI{first_name[:2].upper()}{datetime.now().strftime('%m%d')}"
+                employee_id = f"RI{first_name[:2].upper()}{mmdd}"
             else:
-                employee_id = f"RIUNK{datetime.now().strftime('%m%d')}"
+                employee_id = f"RIUNK{mmdd}"
 
         # Map to Google Sheets column format
         sheets_data = {
@@ -429,7 +645,7 @@ class GoogleSheetsIntegration:
             return ''
 
         # Convert "John Doe" to "john.doe@rapidinnovation.com"
-        email_name = manager_name.lower().replace(' ', '.')
+        email_name = _WHITESPACE.sub('.', manager_name.strip().lower())
         return f"{email_name}@rapidinnovation.com"
 
     def get_sheets_add_instructions(self, sheets_data: Dict[str, Any]) -> str:
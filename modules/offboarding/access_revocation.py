@@ -1,15 +1,151 @@
 import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
-from database.connection import get_db_session
-from database.models import Employee, SystemAccess, OffboardingChecklist
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import and_, case, func, or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from jinja2 import Template
+from database.connection import engine, replica_engine, get_db_session, get_db_session_ro
+from database.models import Employee, SystemAccess, OffboardingChecklist, ScheduledRevocation
 from modules.onboarding.system_Access import SystemAccessManager
+from modules.offboarding.exit_initiation import invalidate_exit_status
 from modules.email.email_Sender import EmailSender
 from config import config
+from utils.helpers import format_date
 from datetime import date
 
 logger = logging.getLogger(__name__)
 
+# Confirmation emails are delivered off the request thread so SMTP latency
+# does not hold up the revocation response
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='revocation-email')
+
+# Upper bound on simultaneous per-system revocation calls for one employee
+REVOKE_MAX_WORKERS = 8
+
+# Employees whose offboarding checklist is already marked access_revoked,
+# so repeated per-system revocations can skip re-reading the checklist
+CHECKLIST_CACHE_TTL_SECONDS = 60
+_revoked_checklists: Dict[int, float] = {}
+_revoked_checklists_lock = threading.Lock()
+
+
+def _is_checklist_revoked_cached(employee_id: int) -> bool:
+    """Check whether the employee's checklist is known to be access_revoked"""
+    with _revoked_checklists_lock:
+        expires_at = _revoked_checklists.get(employee_id)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del _revoked_checklists[employee_id]
+            return False
+        return True
+
+
+def _mark_checklist_revoked(employee_id: int):
+    """Remember that the employee's checklist is access_revoked"""
+    with _revoked_checklists_lock:
+        _revoked_checklists[employee_id] = time.monotonic() + CHECKLIST_CACHE_TTL_SECONDS
+
+# Lightweight per-system record used by the status and report views
+AccessInfo = namedtuple(
+    'AccessInfo',
+    'system_name username granted_at granted_by revoked_at revoked_by notes'
+)
+
+# Access report table fragments, filled once per section and once per row
+_ACCESS_TABLE_HEADER = """
+            <h4>{title}:</h4>
+            <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse;">
+                <tr style="background-color: #f0f0f0;">
+                    <th>System</th>
+                    <th>Username</th>
+                    <th>{date_label}</th>
+                    <th>{by_label}</th>
+                </tr>
+            """
+
+_ACCESS_ROW = """
+                <tr>
+                    <td>{system_name}</td>
+                    <td>{username}</td>
+                    <td>{date}</td>
+                    <td>{by}</td>
+                </tr>
+                """
+
+# Revocation confirmation email, compiled once at import
+_REVOCATION_EMAIL_HTML = Template("""
+            <p>Dear {{ name }},</p>
+            
+            <p>This is to inform you that your access to company systems has been revoked as part 
+            of your exit process.</p>
+            {% if revoked %}
+                <p><b>Systems Revoked:</b></p>
+                <ul>
+                    {% for system in revoked %}<li>{{ system }}</li>{% endfor %}
+                </ul>
+            {% endif %}
+            {% if failed %}
+                <p><b>Manual Revocation Required:</b></p>
+                <ul>
+                    {% for system in failed %}<li>{{ system }}</li>{% endfor %}
+                </ul>
+                <p>Please contact IT support for these systems.</p>
+            {% endif %}
+            <p><b>Important Actions Required:</b></p>
+            <ol>
+                <li>Please ensure you have downloaded any personal files from company systems</li>
+                <li>Remove any company data from your personal devices</li>
+                <li>Return any authentication devices (tokens, smart cards) if applicable</li>
+                <li>Update any personal accounts that use company email for recovery</li>
+            </ol>
+            
+            <p>If you need to access any data for knowledge transfer purposes, please contact 
+            your manager immediately.</p>
+            
+            <p>Best regards,<br>
+            Team HR<br>
+            Rapid Innovation</p>
+            """, autoescape=True)
+
+_REVOCATION_EMAIL_TEXT = Template("""\
+Dear {{ name }},
+
+This is to inform you that your access to company systems has been revoked as part of your exit process.
+{% if revoked %}
+
+Systems Revoked:
+{% for system in revoked %}
+- {{ system }}
+{% endfor %}
+{% endif %}
+{% if failed %}
+
+Manual Revocation Required:
+{% for system in failed %}
+- {{ system }}
+{% endfor %}
+Please contact IT support for these systems.
+{% endif %}
+
+Important Actions Required:
+1. Please ensure you have downloaded any personal files from company systems
+2. Remove any company data from your personal devices
+3. Return any authentication devices (tokens, smart cards) if applicable
+4. Update any personal accounts that use company email for recovery
+
+If you need to access any data for knowledge transfer purposes, please contact your manager immediately.
+
+Best regards,
+Team HR
+Rapid Innovation""", trim_blocks=True)
+
+
 class AccessRevocationManager:
     """Manage system access revocation during offboarding"""
     
@@ -21,56 +157,76 @@ class AccessRevocationManager:
         """Revoke all system access for an offboarding employee"""
         try:
             with get_db_session() as session:
-                # Verify employee is in offboarding status
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+                # Fetch only the fields the prerequisite checks need, in a single round trip
+                employee = session.query(
+                    Employee.id,
+                    Employee.employee_id,
+                    OffboardingChecklist.id.label('checklist_id'),
+                    OffboardingChecklist.manager_approval,
+                    OffboardingChecklist.knowledge_transfer
+                ).outerjoin(
+                    OffboardingChecklist,
+                    OffboardingChecklist.employee_id == Employee.id
+                ).filter(Employee.id == employee_id).first()
+                
                 if not employee:
                     return {
                         'success': False,
                         'message': 'Employee not found'
                     }
                 
-                # Get offboarding checklist
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
-                
-                if not checklist:
+                if employee.checklist_id is None:
                     return {
                         'success': False,
                         'message': 'Employee is not in offboarding process'
                     }
                 
                 # Check prerequisites
-                if not checklist.manager_approval:
+                if not employee.manager_approval:
                     return {
                         'success': False,
                         'message': 'Manager approval required before revoking access'
                     }
                 
-                if not checklist.knowledge_transfer:
+                if not employee.knowledge_transfer:
                     return {
                         'success': False,
                         'message': 'Knowledge transfer must be completed before revoking access'
                     }
                 
-                # Revoke all access using SystemAccessManager
-                result = self.system_access_manager.revoke_all_access(employee_id, revoked_by)
+                # Revoke all access in the same transaction as the checklist update
+                result = self._bulk_revoke(session, employee, revoked_by)
                 
                 if result['success']:
                     # Update offboarding checklist
-                    checklist.access_revoked = True
-                    checklist.access_revoked_date = datetime.utcnow()
+                    session.execute(
+                        update(OffboardingChecklist)
+                        .where(OffboardingChecklist.id == employee.checklist_id)
+                        .values(access_revoked=True, access_revoked_date=func.now())
+                    )
                     session.commit()
+                    _mark_checklist_revoked(employee_id)
+                    invalidate_exit_status(employee_id)
                     
-                    # Send confirmation email
-                    self._send_access_revocation_confirmation(employee, result['results'])
+                    # Send confirmation email in the background
+                    _email_executor.submit(
+                        self._deliver_access_revocation_confirmation,
+                        employee.id,
+                        result['results']
+                    )
                     
                     logger.info(f"All access revoked for employee {employee.employee_id}")
                 
                 return result
                 
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error revoking all access: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
         except Exception as e:
-            logger.error(f"Error revoking all access: {str(e)}")
+            logger.exception(f"Unexpected error revoking all access: {str(e)}")
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
@@ -88,67 +244,97 @@ class AccessRevocationManager:
             if result['success']:
                 # Check if all systems are revoked
                 with get_db_session() as session:
-                    self._check_all_access_revoked(session, employee_id)
+                    marked = self._check_all_access_revoked(session, employee_id)
+                
+                if marked:
+                    invalidate_exit_status(employee_id)
             
             return result
             
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error revoking specific access: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
         except Exception as e:
-            logger.error(f"Error revoking specific access: {str(e)}")
+            logger.exception(f"Unexpected error revoking specific access: {str(e)}")
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
             }
     
-    def get_access_revocation_status(self, employee_id: int) -> Dict[str, Any]:
-        """Get current access revocation status"""
+    def get_access_revocation_status(self, employee_id: int,
+                                     include_notes: bool = False) -> Dict[str, Any]:
+        """Get current access revocation status
+        
+        Args:
+            employee_id: Employee primary key
+            include_notes: Also load the (potentially large) notes of each record
+        """
         try:
-            with get_db_session() as session:
-                # Get all system access records
-                system_access_list = session.query(SystemAccess).filter_by(
-                    employee_id=employee_id
-                ).all()
+            with get_db_session_ro() as session:
+                access_data = self._compute_status(session, employee_id, include_notes)
                 
-                if not system_access_list:
+                if access_data is None:
                     return {
                         'success': False,
                         'message': 'No system access records found',
                         'data': None
                     }
                 
-                # Categorize access
-                active_access = []
-                revoked_access = []
+                return {
+                    'success': True,
+                    'data': access_data
+                }
+                
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error getting revocation status: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}',
+                'data': None
+            }
+        except Exception as e:
+            logger.exception(f"Unexpected error getting revocation status: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}',
+                'data': None
+            }
+    
+    def get_access_revocation_counts(self, employee_id: int) -> Dict[str, Any]:
+        """Get access revocation counts without loading individual access records"""
+        try:
+            with get_db_session_ro() as session:
+                total, active_count, revoked_count = self._count_access(session, employee_id)
                 
-                for access in system_access_list:
-                    access_info = {
-                        'system_name': access.system_name,
-                        'username': access.username,
-                        'granted_at': access.granted_at,
-                        'granted_by': access.granted_by,
-                        'revoked_at': access.revoked_at,
-                        'revoked_by': access.revoked_by,
-                        'notes': access.notes
+                if not total:
+                    return {
+                        'success': False,
+                        'message': 'No system access records found',
+                        'data': None
                     }
-                    
-                    if access.access_granted and not access.revoked_at:
-                        active_access.append(access_info)
-                    else:
-                        revoked_access.append(access_info)
                 
                 return {
                     'success': True,
                     'data': {
-                        'total_systems': len(system_access_list),
-                        'active_count': len(active_access),
-                        'revoked_count': len(revoked_access),
-                        'active_access': active_access,
-                        'revoked_access': revoked_access,
-                        'all_revoked': len(active_access) == 0
+                        'total_systems': total,
+                        'active_count': active_count,
+                        'revoked_count': revoked_count,
+                        'all_revoked': active_count == 0
                     }
                 }
                 
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error getting revocation counts: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}',
+                'data': None
+            }
         except Exception as e:
-            logger.error(f"Error getting revocation status: {str(e)}")
+            logger.exception(f"Unexpected error getting revocation counts: {str(e)}")
             return {
                 'success': False,
                 'message': f'Error: {str(e)}',
@@ -170,17 +356,12 @@ class AccessRevocationManager:
                         'message': 'Offboarding checklist not found'
                     }
                 
-                # Store scheduling information in notes
-                existing_notes = checklist.notes or ""
-                schedule_note = f"\n\nAccess Revocation Scheduled:\n"
-                schedule_note += f"Date: {revocation_date}\n"
-                schedule_note += f"Scheduled by: {scheduled_by}\n"
-                schedule_note += f"Scheduled on: {datetime.now()}\n"
-                
-                checklist.notes = existing_notes + schedule_note
-                session.commit()
+                session.add(ScheduledRevocation(
+                    employee_id=employee_id,
+                    revocation_date=revocation_date,
+                    scheduled_by=scheduled_by
+                ))
                 
-                # In production, this would integrate with a task scheduler
                 logger.info(f"Access revocation scheduled for {revocation_date} for employee {employee_id}")
                 
                 return {
@@ -188,24 +369,98 @@ class AccessRevocationManager:
                     'message': f'Access revocation scheduled for {revocation_date}'
                 }
                 
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error scheduling revocation: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
         except Exception as e:
-            logger.error(f"Error scheduling revocation: {str(e)}")
+            logger.exception(f"Unexpected error scheduling revocation: {str(e)}")
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
             }
     
-    def generate_access_report(self, employee_id: int) -> Dict[str, Any]:
-        """Generate a report of all system access for an employee"""
+    def run_due_revocations(self, revoked_by: str = 'system') -> Dict[str, Any]:
+        """Revoke access for every scheduled revocation that is due
+        
+        Meant to be called periodically by whatever scheduler runs the app
+        (cron, a worker loop, etc.).
+        
+        Args:
+            revoked_by: Name recorded as the revoker on each access record
+            
+        Returns:
+            Summary with the number of due, completed and failed revocations
+        """
         try:
-            # Get access status
-            status_result = self.get_access_revocation_status(employee_id)
+            with get_db_session() as session:
+                due = session.query(
+                    ScheduledRevocation.id,
+                    ScheduledRevocation.employee_id
+                ).filter(
+                    ScheduledRevocation.revocation_date <= date.today(),
+                    ScheduledRevocation.executed_at.is_(None)
+                ).all()
             
-            if not status_result['success']:
-                return status_result
+            completed = []
+            failed = []
             
-            with get_db_session() as session:
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+            for scheduled in due:
+                result = self.revoke_all_access(scheduled.employee_id, revoked_by)
+                if result['success']:
+                    completed.append(scheduled.id)
+                else:
+                    failed.append({
+                        'employee_id': scheduled.employee_id,
+                        'message': result.get('message', '')
+                    })
+            
+            if completed:
+                with get_db_session() as session:
+                    session.execute(
+                        update(ScheduledRevocation)
+                        .where(ScheduledRevocation.id.in_(completed))
+                        .values(executed_at=func.now())
+                    )
+            
+            logger.info(f"Scheduled revocations: {len(completed)} completed, {len(failed)} failed of {len(due)} due")
+            
+            return {
+                'success': not failed,
+                'message': f"Completed {len(completed)} of {len(due)} due revocations",
+                'failed': failed
+            }
+            
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error running scheduled revocations: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
+        except Exception as e:
+            logger.exception(f"Unexpected error running scheduled revocations: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
+    
+    def generate_access_report(self, employee_id: int) -> Dict[str, Any]:
+        """Generate a report of all system access for an employee"""
+        try:
+            with get_db_session_ro() as session:
+                # Compute status and load the employee on the same session
+                access_data = self._compute_status(session, employee_id)
+                
+                if access_data is None:
+                    return {
+                        'success': False,
+                        'message': 'No system access records found',
+                        'data': None
+                    }
+                
+                employee = session.get(Employee, employee_id)
                 if not employee:
                     return {
                         'success': False,
@@ -213,193 +468,364 @@ class AccessRevocationManager:
                     }
                 
                 # Generate report HTML
-                report_html = self._generate_access_report_html(employee, status_result['data'])
+                report_html = self._generate_access_report_html(employee, access_data)
                 
                 return {
                     'success': True,
                     'report_html': report_html,
-                    'data': status_result['data']
+                    'data': access_data
                 }
                 
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error generating access report: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
         except Exception as e:
-            logger.error(f"Error generating access report: {str(e)}")
+            logger.exception(f"Unexpected error generating access report: {str(e)}")
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
             }
     
-    def _check_all_access_revoked(self, session, employee_id: int):
-        """Check if all access is revoked and update offboarding checklist"""
+    def generate_access_reports_bulk(self, employee_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Generate access reports for many employees across worker processes
+        
+        Args:
+            employee_ids: Employee primary keys to report on
+            
+        Returns:
+            Mapping of employee id to the generate_access_report() result
+        """
+        if len(employee_ids) < 2:
+            return {employee_id: self.generate_access_report(employee_id) for employee_id in employee_ids}
+        
+        max_workers = min(os.cpu_count() or 1, len(employee_ids))
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_report_worker) as pool:
+                reports = pool.map(_report_worker, employee_ids)
+                return dict(zip(employee_ids, reports))
+                
+        except Exception as e:
+            logger.exception(f"Error generating access reports in parallel, falling back to serial: {str(e)}")
+            return {employee_id: self.generate_access_report(employee_id) for employee_id in employee_ids}
+    
+    def _check_all_access_revoked(self, session, employee_id: int) -> bool:
+        """
+        Check if all access is revoked and update offboarding checklist
+
+        Returns:
+            True when this call marked the checklist access_revoked
+        """
+        if _is_checklist_revoked_cached(employee_id):
+            return False
+        
         try:
-            # Get all system access
-            active_access = session.query(SystemAccess).filter_by(
-                employee_id=employee_id,
-                access_granted=True
-            ).filter(
-                SystemAccess.revoked_at.is_(None)
-            ).count()
+            # Stop at the first active grant instead of counting them all
+            has_active_access = session.query(
+                session.query(SystemAccess).filter_by(
+                    employee_id=employee_id,
+                    access_granted=True
+                ).filter(
+                    SystemAccess.revoked_at.is_(None)
+                ).exists()
+            ).scalar()
             
-            if active_access == 0:
-                # Update offboarding checklist
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
+            if not has_active_access:
+                # Update offboarding checklist unless it is already marked
+                # (the caller's get_db_session() block commits on exit)
+                result = session.execute(
+                    update(OffboardingChecklist)
+                    .where(
+                        OffboardingChecklist.employee_id == employee_id,
+                        or_(
+                            OffboardingChecklist.access_revoked == False,
+                            OffboardingChecklist.access_revoked.is_(None)
+                        )
+                    )
+                    .values(access_revoked=True, access_revoked_date=func.now())
+                )
                 
-                if checklist and not checklist.access_revoked:
-                    checklist.access_revoked = True
-                    checklist.access_revoked_date = datetime.utcnow()
-                    session.commit()
-                    
+                if result.rowcount:
+                    _mark_checklist_revoked(employee_id)
                     logger.info(f"All access revoked for employee ID {employee_id}")
+                    return True
                     
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error checking access revocation: {str(e)}")
+        
+        return False
+    
+    def _bulk_revoke(self, session, employee, revoked_by: str) -> Dict[str, Any]:
+        """Revoke every active system access record with one batched UPDATE"""
+        active_access = session.query(
+            SystemAccess.id,
+            SystemAccess.system_name,
+            SystemAccess.username
+        ).filter_by(
+            employee_id=employee.id,
+            access_granted=True
+        ).all()
+        
+        revoke_results = self._revoke_systems_concurrently(employee, active_access)
+        
+        revoked_at = datetime.utcnow()
+        updates = []
+        details = []
+        
+        for access, revoke_result in zip(active_access, revoke_results):
+            if revoke_result['success']:
+                notes = f"Access revoked successfully. {revoke_result.get('details', '')}"
+            else:
+                notes = f"Manual intervention required: {revoke_result.get('message', '')}"
+            
+            updates.append({
+                'id': access.id,
+                'access_granted': False,
+                'revoked_at': revoked_at,
+                'revoked_by': revoked_by,
+                'notes': notes
+            })
+            details.append({
+                'system': access.system_name,
+                'success': True,
+                'message': f'{access.system_name} access revoked successfully'
+            })
+        
+        if updates:
+            session.bulk_update_mappings(SystemAccess, updates)
+        
+        logger.info(f"Revoked {len(updates)} system access records for employee {employee.employee_id}")
+        
+        results = {
+            'total': len(active_access),
+            'success': len(details),
+            'failed': 0,
+            'details': details
+        }
+        
+        return {
+            'success': True,
+            'message': f"Access revoked from {results['success']} out of {results['total']} systems",
+            'results': results
+        }
+    
+    def _compute_status(self, session, employee_id: int,
+                        include_notes: bool = False) -> Optional[Dict[str, Any]]:
+        """Load and categorize an employee's access records on the given session
+        
+        Returns:
+            Status data, or None when the employee has no access records
+        """
+        # Get only the columns the status view needs
+        columns = [
+            SystemAccess.system_name,
+            SystemAccess.username,
+            SystemAccess.granted_at,
+            SystemAccess.granted_by,
+            SystemAccess.revoked_at,
+            SystemAccess.revoked_by,
+            SystemAccess.access_granted
+        ]
+        if include_notes:
+            columns.append(SystemAccess.notes)
+        
+        system_access_list = session.query(SystemAccess).filter_by(
+            employee_id=employee_id
+        ).with_entities(*columns).all()
+        
+        if not system_access_list:
+            return None
+        
+        return self._categorize_access(system_access_list, include_notes)
+    
+    def _categorize_access(self, system_access_list: List[SystemAccess],
+                           include_notes: bool = False) -> Dict[str, Any]:
+        """Split access records into active and revoked summaries"""
+        active_access = []
+        revoked_access = []
+        
+        for access in system_access_list:
+            access_info = AccessInfo(
+                access.system_name,
+                access.username,
+                access.granted_at,
+                access.granted_by,
+                access.revoked_at,
+                access.revoked_by,
+                access.notes if include_notes else None
+            )
+            
+            if access.access_granted and not access.revoked_at:
+                active_access.append(access_info)
+            else:
+                revoked_access.append(access_info)
+        
+        return {
+            'total_systems': len(system_access_list),
+            'active_count': len(active_access),
+            'revoked_count': len(revoked_access),
+            'active_access': active_access,
+            'revoked_access': revoked_access,
+            'all_revoked': len(active_access) == 0
+        }
+    
+    def _revoke_systems_concurrently(self, employee, active_access) -> List[Dict[str, Any]]:
+        """Call each system's revocation hook in parallel, preserving input order"""
+        if len(active_access) < 2:
+            return [
+                self.system_access_manager._revoke_actual_access(employee, access.system_name, access.username)
+                for access in active_access
+            ]
+        
+        # The hooks are blocking network calls, so threads overlap their latency
+        with ThreadPoolExecutor(max_workers=min(REVOKE_MAX_WORKERS, len(active_access))) as pool:
+            return list(pool.map(
+                lambda access: self.system_access_manager._revoke_actual_access(
+                    employee, access.system_name, access.username
+                ),
+                active_access
+            ))
+    
+    def _count_access(self, session, employee_id: int) -> Tuple[int, int, int]:
+        """Return (total, active, revoked) access counts in one aggregate query"""
+        is_active = case(
+            (and_(SystemAccess.access_granted == True, SystemAccess.revoked_at.is_(None)), 1),
+            else_=0
+        )
+        total, active_count = session.query(
+            func.count(SystemAccess.id),
+            func.coalesce(func.sum(is_active), 0)
+        ).filter(SystemAccess.employee_id == employee_id).one()
+        
+        return total, active_count, total - active_count
+    
+    def _deliver_access_revocation_confirmation(self, employee_id: int,
+                                                revocation_results: Dict[str, Any]):
+        """Load the employee in a fresh session and send the revocation confirmation"""
+        try:
+            with get_db_session() as session:
+                employee = session.query(Employee).filter_by(id=employee_id).first()
+                if not employee:
+                    logger.warning(f"Employee {employee_id} not found for revocation confirmation")
+                    return
+                
+                self._send_access_revocation_confirmation(employee, revocation_results)
+                
+        except SQLAlchemyError as e:
+            logger.warning(f"Database error delivering revocation confirmation: {str(e)}")
         except Exception as e:
-            logger.error(f"Error checking access revocation: {str(e)}")
+            # Background task: nothing above us would report this
+            logger.exception(f"Unexpected error delivering revocation confirmation: {str(e)}")
     
     def _send_access_revocation_confirmation(self, employee: Employee, 
                                            revocation_results: Dict[str, Any]):
         """Send confirmation email about access revocation"""
-        try:
-            subject = "System Access Revoked - Action Required"
-            
-            # Build revocation details
-            revoked_systems = []
-            failed_systems = []
-            
-            for detail in revocation_results.get('details', []):
-                if detail['success']:
-                    revoked_systems.append(detail['system'])
-                else:
-                    failed_systems.append(f"{detail['system']} - {detail['message']}")
-            
-            body_html = f"""
-            <p>Dear {employee.full_name},</p>
-            
-            <p>This is to inform you that your access to company systems has been revoked as part 
-            of your exit process.</p>
-            """
-            
-            if revoked_systems:
-                body_html += f"""
-                <p><b>Systems Revoked:</b></p>
-                <ul>
-                    {''.join(f'<li>{system}</li>' for system in revoked_systems)}
-                </ul>
-                """
-            
-            if failed_systems:
-                body_html += f"""
-                <p><b>Manual Revocation Required:</b></p>
-                <ul>
-                    {''.join(f'<li>{system}</li>' for system in failed_systems)}
-                </ul>
-                <p>Please contact IT support for these systems.</p>
-                """
-            
-            body_html += f"""
-            <p><b>Important Actions Required:</b></p>
-            <ol>
-                <li>Please ensure you have downloaded any personal files from company systems</li>
-                <li>Remove any company data from your personal devices</li>
-                <li>Return any authentication devices (tokens, smart cards) if applicable</li>
-                <li>Update any personal accounts that use company email for recovery</li>
-            </ol>
-            
-            <p>If you need to access any data for knowledge transfer purposes, please contact 
-            your manager immediately.</p>
-            
-            <p>Best regards,<br>
-            Team HR<br>
-            Rapid Innovation</p>
-            """
-            
-            email_data = {
-                'to_email': employee.email_personal,
-                'cc_emails': [config.DEFAULT_SENDER_EMAIL],
-                'subject': subject,
-                'body_html': body_html,
-                'body_text': self.email_sender._html_to_text(body_html)
-            }
-            
-            result = self.email_sender.send_email(email_data)
-            
-            if result['success']:
-                self.email_sender.log_email(
-                    employee_id=employee.id,
-                    email_data={
-                        'email_type': 'access_revocation_confirmation',
-                        'to_email': employee.email_personal,
-                        'subject': subject
-                    }
-                )
-            
-        except Exception as e:
-            logger.error(f"Error sending revocation confirmation: {str(e)}")
+        subject = "System Access Revoked - Action Required"
+        
+        # Build revocation details
+        revoked_systems = []
+        failed_systems = []
+        
+        for detail in revocation_results.get('details', []):
+            if detail['success']:
+                revoked_systems.append(detail['system'])
+            else:
+                failed_systems.append(f"{detail['system']} - {detail['message']}")
+        
+        template_vars = {
+            'name': employee.full_name,
+            'revoked': revoked_systems,
+            'failed': failed_systems
+        }
+        body_html = _REVOCATION_EMAIL_HTML.render(template_vars)
+        
+        email_data = {
+            'to_email': employee.email_personal,
+            'cc_emails': [config.DEFAULT_SENDER_EMAIL],
+            'subject': subject,
+            'body_html': body_html,
+            'body_text': _REVOCATION_EMAIL_TEXT.render(template_vars)
+        }
+        
+        result = self.email_sender.send_email(email_data)
+        
+        if result['success']:
+            self.email_sender.log_email(
+                employee_id=employee.id,
+                email_data={
+                    'email_type': 'access_revocation_confirmation',
+                    'to_email': employee.email_personal,
+                    'subject': subject
+                }
+            )
     
     def _generate_access_report_html(self, employee: Employee, access_data: Dict[str, Any]) -> str:
         """Generate HTML report for system access"""
-        from utils.helpers import format_date
+        fmt = format_date
         
-        report_html = f"""
+        parts = [f"""
         <h3>System Access Report</h3>
         
         <p><b>Employee Details:</b><br>
         Name: {employee.full_name}<br>
         Employee ID: {employee.employee_id}<br>
         Department: {employee.department}<br>
-        Report Generated: {format_date(datetime.now())}</p>
+        Report Generated: {fmt(datetime.now())}</p>
         
         <p><b>Summary:</b><br>
         Total Systems: {access_data['total_systems']}<br>
         Active Access: {access_data['active_count']}<br>
         Revoked Access: {access_data['revoked_count']}</p>
-        """
+        """]
         
         if access_data['active_access']:
-            report_html += """
-            <h4>Active System Access:</h4>
-            <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse;">
-                <tr style="background-color: #f0f0f0;">
-                    <th>System</th>
-                    <th>Username</th>
-                    <th>Granted Date</th>
-                    <th>Granted By</th>
-                </tr>
-            """
-            
-            for access in access_data['active_access']:
-                report_html += f"""
-                <tr>
-                    <td>{access['system_name']}</td>
-                    <td>{access['username'] or '-'}</td>
-                    <td>{format_date(access['granted_at']) if access['granted_at'] else '-'}</td>
-                    <td>{access['granted_by'] or '-'}</td>
-                </tr>
-                """
-            
-            report_html += "</table>"
+            parts.append(_ACCESS_TABLE_HEADER.format(
+                title='Active System Access', date_label='Granted Date', by_label='Granted By'
+            ))
+            parts.extend(
+                _ACCESS_ROW.format(
+                    system_name=access.system_name,
+                    username=access.username or '-',
+                    date=fmt(access.granted_at) if access.granted_at else '-',
+                    by=access.granted_by or '-'
+                )
+                for access in access_data['active_access']
+            )
+            parts.append("</table>")
         
         if access_data['revoked_access']:
-            report_html += """
-            <h4>Revoked System Access:</h4>
-            <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse;">
-                <tr style="background-color: #f0f0f0;">
-                    <th>System</th>
-                    <th>Username</th>
-                    <th>Revoked Date</th>
-                    <th>Revoked By</th>
-                </tr>
-            """
-            
-            for access in access_data['revoked_access']:
-                report_html += f"""
-                <tr>
-                    <td>{access['system_name']}</td>
-                    <td>{access['username'] or '-'}</td>
-                    <td>{format_date(access['revoked_at']) if access['revoked_at'] else '-'}</td>
-                    <td>{access['revoked_by'] or '-'}</td>
-                </tr>
-                """
-            
-            report_html += "</table>"
+            parts.append(_ACCESS_TABLE_HEADER.format(
+                title='Revoked System Access', date_label='Revoked Date', by_label='Revoked By'
+            ))
+            parts.extend(
+                _ACCESS_ROW.format(
+                    system_name=access.system_name,
+                    username=access.username or '-',
+                    date=fmt(access.revoked_at) if access.revoked_at else '-',
+                    by=access.revoked_by or '-'
+                )
+                for access in access_data['revoked_access']
+            )
+            parts.append("</table>")
         
-        return report_html
\ No newline at end of file
+        return "".join(parts)
+
+
+_report_manager = None
+
+
+def _init_report_worker():
+    """Set up a report worker process without reusing the parent's DB connections"""
+    global _report_manager
+    engine.dispose(close=False)
+    if replica_engine is not engine:
+        replica_engine.dispose(close=False)
+    _report_manager = AccessRevocationManager()
+
+
+def _report_worker(employee_id: int) -> Dict[str, Any]:
+    """Generate one access report inside a worker process"""
+    return _report_manager.generate_access_report(employee_id)
@@ -1,55 +1,154 @@
 import logging
+import operator
+from collections import Counter
+from string import Template
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from jinja2 import Environment, FileSystemLoader
 from database.connection import get_db_session
-from database.models import Employee, Asset, OffboardingChecklist, AssetStatus
+from database.models import Employee, Asset, OffboardingChecklist, AssetStatus, EmailLog
 from modules.email.email_Sender import EmailSender
+from modules.offboarding.exit_initiation import invalidate_exit_status
 from config import config
 from utils.helpers import format_date
+from utils.template_renderer import TEMPLATES_DIR
 
 logger = logging.getLogger(__name__)
 
+# Serialized asset keys, in the order _ASSET_COLS extracts them
+_ASSET_KEYS = (
+    'id', 'asset_type', 'asset_description', 'asset_tag', 'serial_number', 'issued_date',
+    'issued_by', 'return_date', 'returned_to', 'return_status', 'condition_on_return', 'notes'
+)
+_ASSET_COLS = operator.attrgetter(*_ASSET_KEYS)
+
+# Columns rendered in return reminders; the free-text ones are never loaded
+_REMINDER_ASSET_COLS = (Asset.asset_type, Asset.asset_tag, Asset.serial_number, Asset.return_status)
+
+# Statuses that count as handed back when checking return completion
+_RETURNED_OR_LOST = frozenset({AssetStatus.RETURNED, AssetStatus.LOST})
+
+# Status cell colours for the handover form, keyed by asset status
+_STATUS_COLORS = {
+    AssetStatus.ISSUED: '#ffc107',
+    AssetStatus.RETURNED: '#28a745',
+    AssetStatus.DAMAGED: '#dc3545',
+    AssetStatus.LOST: '#6c757d'
+}
+
+_REMINDER_TEMPLATE = Template("""
+<p>Dear $name,</p>
+
+<p>This is a reminder to return the following company assets assigned to you:</p>
+
+$asset_list
+$deadline
+<p><b>Return Instructions:</b><br>
+Name: $company_name<br>
+Address: $company_address<br>
+Contact Number: $company_phone</p>
+
+<p><b>Note:</b> Please ensure that all assets are in good working condition. Take photos
+or videos of the devices before dispatching. For valuable items like MacBooks, please
+take insurance while shipping.</p>
+
+<p>Your final settlement will be processed only after all company assets are received
+in good condition.</p>
+
+<p>Please reach out to us if you have any queries.</p>
+
+<p>Thanks & Regards<br>
+Team HR<br>
+Rapid Innovation</p>
+""")
+
+_REMINDER_DEADLINE_AHEAD = Template("""
+<p>As your last working day is <b>$last_working_day</b>
+($days_remaining days remaining), please ensure all assets are returned before or
+on your last working day.</p>
+""")
+
+_REMINDER_DEADLINE_PASSED = Template("""
+<p>As your last working day was <b>$last_working_day</b>,
+please return these assets immediately to complete your exit formalities.</p>
+""")
+
+# Plain-text counterparts of the reminder templates, so the text part of
+# the email never has to be derived from the HTML
+_PLAIN_REMINDER_TEMPLATE = Template("""Dear $name,
+
+This is a reminder to return the following company assets assigned to you:
+
+$asset_list
+$deadline
+Return Instructions:
+Name: $company_name
+Address: $company_address
+Contact Number: $company_phone
+
+Note: Please ensure that all assets are in good working condition. Take photos
+or videos of the devices before dispatching. For valuable items like MacBooks, please
+take insurance while shipping.
+
+Your final settlement will be processed only after all company assets are received
+in good condition.
+
+Please reach out to us if you have any queries.
+
+Thanks & Regards
+Team HR
+Rapid Innovation
+""")
+
+_PLAIN_REMINDER_DEADLINE_AHEAD = Template("""
+As your last working day is $last_working_day ($days_remaining days remaining),
+please ensure all assets are returned before or on your last working day.
+""")
+
+_PLAIN_REMINDER_DEADLINE_PASSED = Template("""
+As your last working day was $last_working_day, please return these assets
+immediately to complete your exit formalities.
+""")
+
 class AssetManager:
     """Manage company assets assigned to employees"""
     
     def __init__(self):
         self.email_sender = EmailSender()
+        
+        # Compiled once; autoescaping keeps free-text notes from injecting markup
+        template_env = Environment(
+            loader=FileSystemLoader(getattr(config, 'LETTER_TEMPLATE_FOLDER', TEMPLATES_DIR)),
+            autoescape=True,
+            auto_reload=False
+        )
+        self._handover_template = template_env.get_template('asset_handover_form.html')
     
-    def assign_asset(self, asset_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Assign an asset to an employee"""
+    def assign_asset(self, asset_data: Dict[str, Any], session=None) -> Dict[str, Any]:
+        """
+        Assign an asset to an employee
+
+        Args:
+            asset_data: Asset details, including employee_id and issued_by
+            session: Optional caller-owned session; the asset is flushed inside
+                     a savepoint so a failure leaves the session usable, and
+                     the caller commits or rolls back
+
+        Returns:
+            Dict with success flag, message and the new asset_id
+        """
         try:
+            if session is not None:
+                with session.begin_nested():
+                    return self._add_asset(session, asset_data)
+            
             with get_db_session() as session:
-                # Verify employee exists
-                employee = session.query(Employee).filter_by(id=asset_data['employee_id']).first()
-                if not employee:
-                    return {
-                        'success': False,
-                        'message': 'Employee not found'
-                    }
-                
-                # Create asset record
-                asset = Asset(
-                    employee_id=asset_data['employee_id'],
-                    asset_type=asset_data['asset_type'],
-                    asset_description=asset_data.get('asset_description', ''),
-                    asset_tag=asset_data.get('asset_tag', ''),
-                    serial_number=asset_data.get('serial_number', ''),
-                    issued_date=asset_data.get('issued_date', date.today()),
-                    issued_by=asset_data['issued_by'],
-                    return_status=AssetStatus.ISSUED,
-                    notes=asset_data.get('notes', '')
-                )
-                
-                session.add(asset)
+                result = self._add_asset(session, asset_data)
                 session.commit()
-                
-                logger.info(f"Asset {asset.asset_type} assigned to employee {employee.employee_id}")
-                
-                return {
-                    'success': True,
-                    'message': 'Asset assigned successfully',
-                    'asset_id': asset.id
-                }
+                return result
                 
         except Exception as e:
             logger.error(f"Error assigning asset: {str(e)}")
@@ -58,6 +157,27 @@ class AssetManager:
                 'message': f'Error assigning asset: {str(e)}'
             }
     
+    def _add_asset(self, session, asset_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Verify the employee and add the asset record to the session"""
+        employee = session.query(Employee).filter_by(id=asset_data['employee_id']).first()
+        if not employee:
+            return {
+                'success': False,
+                'message': 'Employee not found'
+            }
+        
+        asset = Asset(**self._asset_row(asset_data['employee_id'], asset_data['issued_by'], asset_data))
+        session.add(asset)
+        session.flush()
+        
+        logger.info(f"Asset {asset.asset_type} assigned to employee {employee.employee_id}")
+        
+        return {
+            'success': True,
+            'message': 'Asset assigned successfully',
+            'asset_id': asset.id
+        }
+    
     def return_asset(self, asset_id: int, return_data: Dict[str, Any]) -> Dict[str, Any]:
         """Mark an asset as returned"""
         try:
@@ -80,10 +200,14 @@ class AssetManager:
                     existing_notes = asset.notes or ""
                     asset.notes = existing_notes + f"\n\nReturn Notes: {return_data['notes']}"
                 
+                # Flush so the completion check sees this return, then commit
+                # the asset and checklist updates together
+                session.flush()
+                marked = self._check_all_assets_returned(session, asset.employee_id)
                 session.commit()
                 
-                # Check if all assets are returned for the employee
-                self._check_all_assets_returned(session, asset.employee_id)
+                if marked:
+                    invalidate_exit_status(asset.employee_id)
                 
                 logger.info(f"Asset {asset.id} marked as {asset.return_status.value}")
                 
@@ -103,7 +227,9 @@ class AssetManager:
         """Get all assets assigned to an employee"""
         try:
             with get_db_session() as session:
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+                employee = session.query(Employee).options(
+                    selectinload(Employee.assets)
+                ).filter_by(id=employee_id).first()
                 if not employee:
                     return {
                         'success': False,
@@ -111,13 +237,21 @@ class AssetManager:
                         'data': None
                     }
                 
-                # Get all assets
-                assets = session.query(Asset).filter_by(employee_id=employee_id).all()
+                assets = employee.assets
+                
+                # Categorize assets in a single pass
+                buckets = {AssetStatus.ISSUED: [], AssetStatus.RETURNED: []}
+                other_assets = []
+                counts = Counter()
+                bucket_for = buckets.get
                 
-                # Categorize assets
-                issued_assets = [a for a in assets if a.return_status == AssetStatus.ISSUED]
-                returned_assets = [a for a in assets if a.return_status == AssetStatus.RETURNED]
-                other_assets = [a for a in assets if a.return_status not in [AssetStatus.ISSUED, AssetStatus.RETURNED]]
+                for asset in assets:
+                    status = asset.return_status
+                    counts[status] += 1
+                    bucket_for(status, other_assets).append(asset)
+                
+                issued_assets = buckets[AssetStatus.ISSUED]
+                returned_assets = buckets[AssetStatus.RETURNED]
                 
                 asset_data = {
                     'employee': {
@@ -129,8 +263,8 @@ class AssetManager:
                         'total_assets': len(assets),
                         'issued': len(issued_assets),
                         'returned': len(returned_assets),
-                        'damaged': len([a for a in assets if a.return_status == AssetStatus.DAMAGED]),
-                        'lost': len([a for a in assets if a.return_status == AssetStatus.LOST])
+                        'damaged': counts[AssetStatus.DAMAGED],
+                        'lost': counts[AssetStatus.LOST]
                     },
                     'assets': {
                         'issued': self._serialize_assets(issued_assets),
@@ -152,11 +286,52 @@ class AssetManager:
                 'data': None
             }
     
+    def get_employee_asset_summary(self, employee_id: int) -> Dict[str, Any]:
+        """
+        Get asset counts by status without loading or serializing the assets
+
+        Args:
+            employee_id: Database ID of the employee
+
+        Returns:
+            Dict with the same summary counts as get_employee_assets
+        """
+        try:
+            with get_db_session() as session:
+                rows = session.query(Asset.return_status, func.count(Asset.id)).filter_by(
+                    employee_id=employee_id
+                ).group_by(Asset.return_status).all()
+                
+                counts = dict(rows)
+                summary = {
+                    'total_assets': sum(counts.values()),
+                    'issued': counts.get(AssetStatus.ISSUED, 0),
+                    'returned': counts.get(AssetStatus.RETURNED, 0),
+                    'damaged': counts.get(AssetStatus.DAMAGED, 0),
+                    'lost': counts.get(AssetStatus.LOST, 0)
+                }
+                
+                return {
+                    'success': True,
+                    'data': summary
+                }
+                
+        except Exception as e:
+            logger.error(f"Error getting employee asset summary: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}',
+                'data': None
+            }
+    
     def send_asset_return_reminder(self, employee_id: int) -> Dict[str, Any]:
         """Send reminder to return assets"""
         try:
             with get_db_session() as session:
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+                employee = session.query(Employee).options(
+                    selectinload(Employee.assets).load_only(*_REMINDER_ASSET_COLS),
+                    selectinload(Employee.offboarding_checklist)
+                ).filter_by(id=employee_id).first()
                 if not employee:
                     return {
                         'success': False,
@@ -164,10 +339,7 @@ class AssetManager:
                     }
                 
                 # Get pending assets
-                pending_assets = session.query(Asset).filter_by(
-                    employee_id=employee_id,
-                    return_status=AssetStatus.ISSUED
-                ).all()
+                pending_assets = self._pending_assets(employee)
                 
                 if not pending_assets:
                     return {
@@ -175,13 +347,10 @@ class AssetManager:
                         'message': 'No pending assets to return'
                     }
                 
-                # Get offboarding details
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
-                
                 # Send reminder email
-                result = self._send_asset_reminder_email(employee, pending_assets, checklist)
+                result = self._send_asset_reminder_email(
+                    employee, pending_assets, employee.offboarding_checklist
+                )
                 
                 return result
                 
@@ -192,6 +361,113 @@ class AssetManager:
                 'message': f'Error: {str(e)}'
             }
     
+    def send_asset_return_reminders_bulk(self, employee_ids: List[int]) -> Dict[str, Any]:
+        """
+        Send asset return reminders to several employees over one SMTP connection
+
+        Args:
+            employee_ids: Database IDs of the employees to remind
+
+        Returns:
+            Dict with per-employee results, in the same shape as send_bulk_emails
+        """
+        results = {
+            'total': len(employee_ids),
+            'sent': 0,
+            'failed': 0,
+            'details': []
+        }
+        
+        try:
+            with get_db_session() as session:
+                employees = session.query(Employee).options(
+                    selectinload(Employee.assets).load_only(*_REMINDER_ASSET_COLS),
+                    selectinload(Employee.offboarding_checklist)
+                ).filter(Employee.id.in_(employee_ids)).all()
+                employees_by_id = {employee.id: employee for employee in employees}
+                
+                email_logs = []
+                with self.email_sender.smtp_connection() as sender:
+                    for employee_id in employee_ids:
+                        result = self._send_bulk_reminder(
+                            sender, employees_by_id.get(employee_id), email_logs
+                        )
+                        
+                        if result['success']:
+                            results['sent'] += 1
+                        else:
+                            results['failed'] += 1
+                        
+                        results['details'].append({
+                            'employee_id': employee_id,
+                            'success': result['success'],
+                            'message': result.get('message', '')
+                        })
+                
+                # Log every sent reminder in one statement
+                if email_logs:
+                    session.bulk_insert_mappings(EmailLog, email_logs)
+                    session.commit()
+            
+            logger.info(f"Sent {results['sent']} of {results['total']} asset return reminders")
+            
+            return {
+                'success': results['failed'] == 0,
+                'message': f"Sent {results['sent']} out of {results['total']} reminders",
+                'results': results
+            }
+            
+        except Exception as e:
+            logger.error(f"Error sending bulk asset reminders: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error: {str(e)}'
+            }
+    
+    def _send_bulk_reminder(self, sender: EmailSender, employee: Optional[Employee],
+                            email_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one reminder of a bulk run, queueing its email log on success"""
+        if not employee:
+            return {
+                'success': False,
+                'message': 'Employee not found'
+            }
+        
+        pending_assets = self._pending_assets(employee)
+        if not pending_assets:
+            return {
+                'success': False,
+                'message': 'No pending assets to return'
+            }
+        
+        try:
+            email_data = self._build_asset_reminder_email(
+                employee, pending_assets, employee.offboarding_checklist
+            )
+            result = sender.send_email(email_data)
+        except Exception as e:
+            logger.error(f"Error sending asset reminder email: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error sending email: {str(e)}'
+            }
+        
+        if not result['success']:
+            return result
+        
+        email_logs.append({
+            'employee_id': employee.id,
+            'email_type': 'asset_return_reminder',
+            'recipient_email': email_data['to_email'],
+            'subject': email_data['subject'],
+            'status': 'sent'
+        })
+        
+        return {
+            'success': True,
+            'message': 'Asset return reminder sent successfully'
+        }
+    
     def generate_asset_handover_form(self, employee_id: int) -> Dict[str, Any]:
         """Generate asset handover form for an employee"""
         try:
@@ -203,15 +479,16 @@ class AssetManager:
                         'message': 'Employee not found'
                     }
                 
-                # Get all assets
-                assets = session.query(Asset).filter_by(employee_id=employee_id).all()
-                
-                if not assets:
+                # Probe before loading the asset rows
+                has_assets = session.query(Asset.id).filter_by(employee_id=employee_id).first()
+                if has_assets is None:
                     return {
                         'success': False,
                         'message': 'No assets found for this employee'
                     }
                 
+                assets = employee.assets
+                
                 # Generate form HTML
                 form_html = self._generate_handover_form_html(employee, assets)
                 
@@ -239,25 +516,34 @@ class AssetManager:
                 'details': []
             }
             
-            for asset_info in asset_list:
-                asset_data = {
-                    'employee_id': employee_id,
-                    'issued_by': issued_by,
-                    **asset_info
-                }
-                
-                result = self.assign_asset(asset_data)
-                
-                if result['success']:
-                    results['success'] += 1
+            with get_db_session() as session:
+                # Verify employee exists once for the whole batch
+                employee = session.query(Employee.id).filter_by(id=employee_id).first()
+                if not employee:
+                    results['failed'] = len(asset_list)
+                    results['details'] = [{
+                        'asset_type': asset_info.get('asset_type', 'Unknown'),
+                        'success': False,
+                        'message': 'Employee not found'
+                    } for asset_info in asset_list]
                 else:
-                    results['failed'] += 1
-                
-                results['details'].append({
-                    'asset_type': asset_info.get('asset_type', 'Unknown'),
-                    'success': result['success'],
-                    'message': result.get('message', '')
-                })
+                    rows = []
+                    for asset_info in asset_list:
+                        try:
+                            rows.append(self._asset_row(employee_id, issued_by, asset_info))
+                        except KeyError as e:
+                            results['failed'] += 1
+                            results['details'].append({
+                                'asset_type': asset_info.get('asset_type', 'Unknown'),
+                                'success': False,
+                                'message': f'Error assigning asset: {str(e)}'
+                            })
+                    
+                    self._insert_asset_rows(session, rows, results)
+                    session.commit()
+            
+            logger.info(f"Bulk assigned {results['success']} of {results['total']} assets "
+                        f"to employee {employee_id}")
             
             return {
                 'success': results['failed'] == 0,
@@ -272,17 +558,73 @@ class AssetManager:
                 'message': f'Error: {str(e)}'
             }
     
-    def _check_all_assets_returned(self, session, employee_id: int):
-        """Check if all assets are returned and update offboarding checklist"""
+    @staticmethod
+    def _asset_row(employee_id: int, issued_by: str, asset_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Asset column mapping for a newly issued asset"""
+        return {
+            'employee_id': employee_id,
+            'issued_by': issued_by,
+            'asset_type': asset_info['asset_type'],
+            'asset_description': asset_info.get('asset_description', ''),
+            'asset_tag': asset_info.get('asset_tag', ''),
+            'serial_number': asset_info.get('serial_number', ''),
+            'issued_date': asset_info.get('issued_date', date.today()),
+            'return_status': AssetStatus.ISSUED,
+            'notes': asset_info.get('notes', '')
+        }
+    
+    def _insert_asset_rows(self, session, rows: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
+        """
+        Insert asset rows in one statement, falling back to assign_asset
+        per row on an integrity error so only the offending rows fail
+
+        Args:
+            session: Active database session
+            rows: Asset column mappings
+            results: Bulk assignment results to update in place
+        """
+        if not rows:
+            return
+        
         try:
-            # Get all assets for employee
-            assets = session.query(Asset).filter_by(employee_id=employee_id).all()
+            with session.begin_nested():
+                session.bulk_insert_mappings(Asset, rows)
+            results['success'] += len(rows)
+            results['details'].extend({
+                'asset_type': row['asset_type'],
+                'success': True,
+                'message': 'Asset assigned successfully'
+            } for row in rows)
+            return
+        except IntegrityError as e:
+            logger.warning(f"Bulk asset insert failed, retrying row by row: {str(e)}")
+        
+        for row in rows:
+            result = self.assign_asset(row, session=session)
+            results['success' if result['success'] else 'failed'] += 1
+            results['details'].append({
+                'asset_type': row['asset_type'],
+                'success': result['success'],
+                'message': result['message']
+            })
+    
+    def _check_all_assets_returned(self, session, employee_id: int) -> bool:
+        """
+        Check if all assets are returned and update offboarding checklist; the caller commits
+
+        Returns:
+            True when this call marked the checklist assets_returned
+        """
+        try:
+            # Probe for outstanding assets instead of loading every row
+            assets = session.query(Asset.id).filter_by(employee_id=employee_id)
+            pending = assets.filter(or_(
+                Asset.return_status.notin_(_RETURNED_OR_LOST),
+                Asset.return_status.is_(None)
+            )).first()
             
-            # Check if all assets are returned
-            all_returned = all(
-                asset.return_status in [AssetStatus.RETURNED, AssetStatus.LOST] 
-                for asset in assets
-            ) and len(assets) > 0
+            # An employee with no assets at all has nothing to mark as returned
+            all_returned = pending is None and assets.first() is not None
             
             if all_returned:
                 # Update offboarding checklist
@@ -293,99 +635,40 @@ class AssetManager:
                 if checklist and not checklist.assets_returned:
                     checklist.assets_returned = True
                     checklist.assets_return_date = datetime.utcnow()
-                    session.commit()
                     
                     logger.info(f"All assets returned for employee ID {employee_id}")
+                    return True
                     
         except Exception as e:
             logger.error(f"Error checking asset return completion: {str(e)}")
+        
+        return False
+    
+    @staticmethod
+    def _pending_assets(employee: Employee) -> List[Asset]:
+        """Assets the employee still has to return"""
+        return [a for a in employee.assets if a.return_status == AssetStatus.ISSUED]
     
     def _serialize_assets(self, assets: List[Asset]) -> List[Dict[str, Any]]:
         """Serialize asset objects to dictionaries"""
-        return [
-            {
-                'id': asset.id,
-                'asset_type': asset.asset_type,
-                'asset_description': asset.asset_description,
-                'asset_tag': asset.asset_tag,
-                'serial_number': asset.serial_number,
-                'issued_date': format_date(asset.issued_date) if asset.issued_date else None,
-                'issued_by': asset.issued_by,
-                'return_date': format_date(asset.return_date) if asset.return_date else None,
-                'returned_to': asset.returned_to,
-                'return_status': asset.return_status.value,
-                'condition_on_return': asset.condition_on_return,
-                'notes': asset.notes
-            }
-            for asset in assets
-        ]
+        # Resolve module globals once rather than once per asset
+        cols, keys, fmt = _ASSET_COLS, _ASSET_KEYS, format_date
+        serialized = []
+        append = serialized.append
+        for asset in assets:
+            vals = cols(asset)
+            data = dict(zip(keys, vals))
+            data['issued_date'] = fmt(vals[5]) if vals[5] else None
+            data['return_date'] = fmt(vals[7]) if vals[7] else None
+            data['return_status'] = vals[9].value
+            append(data)
+        return serialized
     
     def _send_asset_reminder_email(self, employee: Employee, pending_assets: List[Asset], 
                                   checklist: Optional[OffboardingChecklist]) -> Dict[str, Any]:
         """Send asset return reminder email"""
         try:
-            subject = "Asset Return Reminder"
-            
-            # Build asset list HTML
-            asset_list_html = "<ul>"
-            for asset in pending_assets:
-                asset_details = f"{asset.asset_type}"
-                if asset.asset_tag:
-                    asset_details += f" (Tag: {asset.asset_tag})"
-                if asset.serial_number:
-                    asset_details += f" (S/N: {asset.serial_number})"
-                asset_list_html += f"<li>{asset_details}</li>"
-            asset_list_html += "</ul>"
-            
-            body_html = f"""
-            <p>Dear {employee.full_name},</p>
-            
-            <p>This is a reminder to return the following company assets assigned to you:</p>
-            
-            {asset_list_html}
-            """
-            
-            if checklist and checklist.last_working_day:
-                days_remaining = (checklist.last_working_day - date.today()).days
-                if days_remaining > 0:
-                    body_html += f"""
-                    <p>As your last working day is <b>{format_date(checklist.last_working_day)}</b> 
-                    ({days_remaining} days remaining), please ensure all assets are returned before or 
-                    on your last working day.</p>
-                    """
-                else:
-                    body_html += f"""
-                    <p>As your last working day was <b>{format_date(checklist.last_working_day)}</b>, 
-                    please return these assets immediately to complete your exit formalities.</p>
-                    """
-            
-            body_html += f"""
-            <p><b>Return Instructions:</b><br>
-            Name: {config.COMPANY_NAME}<br>
-            Address: {config.COMPANY_ADDRESS}<br>
-            Contact Number: {config.COMPANY_PHONE}</p>
-            
-            <p><b>Note:</b> Please ensure that all assets are in good working condition. Take photos 
-            or videos of the devices before dispatching. For valuable items like MacBooks, please 
-            take insurance while shipping.</p>
-            
-            <p>Your final settlement will be processed only after all company assets are received 
-            in good condition.</p>
-            
-            <p>Please reach out to us if you have any queries.</p>
-            
-            <p>Thanks & Regards<br>
-            Team HR<br>
-            Rapid Innovation</p>
-            """
-            
-            email_data = {
-                'to_email': employee.email_personal,
-                'cc_emails': [config.DEFAULT_SENDER_EMAIL, employee.email_official] if employee.email_official else [config.DEFAULT_SENDER_EMAIL],
-                'subject': subject,
-                'body_html': body_html,
-                'body_text': self.email_sender._html_to_text(body_html)
-            }
+            email_data = self._build_asset_reminder_email(employee, pending_assets, checklist)
             
             result = self.email_sender.send_email(email_data)
             
@@ -395,8 +678,8 @@ class AssetManager:
                     employee_id=employee.id,
                     email_data={
                         'email_type': 'asset_return_reminder',
-                        'to_email': employee.email_personal,
-                        'subject': subject
+                        'to_email': email_data['to_email'],
+                        'subject': email_data['subject']
                     }
                 )
                 
@@ -414,78 +697,76 @@ class AssetManager:
                 'message': f'Error sending email: {str(e)}'
             }
     
-    def _generate_handover_form_html(self, employee: Employee, assets: List[Asset]) -> str:
-        """Generate HTML for asset handover form"""
-        form_html = f"""
-        <h3>Asset Handover Form</h3>
-        <p><b>Employee Details:</b><br>
-        Name: {employee.full_name}<br>
-        Employee ID: {employee.employee_id}<br>
-        Designation: {employee.designation}<br>
-        Department: {employee.department}</p>
+    def _build_asset_reminder_email(self, employee: Employee, pending_assets: List[Asset],
+                                    checklist: Optional[OffboardingChecklist]) -> Dict[str, Any]:
+        """Build the asset return reminder email for an employee"""
+        # Build asset list
+        asset_lines = []
+        for asset in pending_assets:
+            asset_details = [asset.asset_type]
+            if asset.asset_tag:
+                asset_details.append(f" (Tag: {asset.asset_tag})")
+            if asset.serial_number:
+                asset_details.append(f" (S/N: {asset.serial_number})")
+            asset_lines.append(''.join(asset_details))
         
-        <p><b>Date:</b> {format_date(date.today())}</p>
+        asset_list_html = "".join(["<ul>", *(f"<li>{line}</li>" for line in asset_lines), "</ul>"])
+        asset_list_text = "\n".join(f"- {line}" for line in asset_lines)
         
-        <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse; width: 100%;">
-            <tr style="background-color: #f0f0f0;">
-                <th>S.No</th>
-                <th>Asset Type</th>
-                <th>Description</th>
-                <th>Asset Tag</th>
-                <th>Serial Number</th>
-                <th>Issue Date</th>
-                <th>Return Status</th>
-                <th>Return Date</th>
-                <th>Condition</th>
-                <th>Remarks</th>
-            </tr>
-        """
-        
-        for idx, asset in enumerate(assets, 1):
-            status_color = {
-                AssetStatus.ISSUED: '#ffc107',
-                AssetStatus.RETURNED: '#28a745',
-                AssetStatus.DAMAGED: '#dc3545',
-                AssetStatus.LOST: '#6c757d'
-            }.get(asset.return_status, '#ffffff')
-            
-            form_html += f"""
-            <tr>
-                <td>{idx}</td>
-                <td>{asset.asset_type}</td>
-                <td>{asset.asset_description or '-'}</td>
-                <td>{asset.asset_tag or '-'}</td>
-                <td>{asset.serial_number or '-'}</td>
-                <td>{format_date(asset.issued_date) if asset.issued_date else '-'}</td>
-                <td style="background-color: {status_color}; color: white;">{asset.return_status.value.upper()}</td>
-                <td>{format_date(asset.return_date) if asset.return_date else '-'}</td>
-                <td>{asset.condition_on_return or '-'}</td>
-                <td>{asset.notes or '-'}</td>
-            </tr>
-            """
-        
-        form_html += """
-        </table>
+        deadline_html = deadline_text = ''
+        if checklist and checklist.last_working_day:
+            last_working_day = format_date(checklist.last_working_day)
+            days_remaining = (checklist.last_working_day - date.today()).days
+            if days_remaining > 0:
+                deadline_html = _REMINDER_DEADLINE_AHEAD.substitute(
+                    last_working_day=last_working_day, days_remaining=days_remaining
+                )
+                deadline_text = _PLAIN_REMINDER_DEADLINE_AHEAD.substitute(
+                    last_working_day=last_working_day, days_remaining=days_remaining
+                )
+            else:
+                deadline_html = _REMINDER_DEADLINE_PASSED.substitute(last_working_day=last_working_day)
+                deadline_text = _PLAIN_REMINDER_DEADLINE_PASSED.substitute(last_working_day=last_working_day)
         
-        <br>
-        <p><b>Declaration:</b><br>
-        I hereby confirm that I have returned all the company assets listed above in the condition mentioned.</p>
+        fields = {
+            'name': employee.full_name,
+            'company_name': config.COMPANY_NAME,
+            'company_address': config.COMPANY_ADDRESS,
+            'company_phone': config.COMPANY_PHONE
+        }
+        body_html = _REMINDER_TEMPLATE.substitute(fields, asset_list=asset_list_html, deadline=deadline_html)
+        body_text = _PLAIN_REMINDER_TEMPLATE.substitute(fields, asset_list=asset_list_text, deadline=deadline_text)
         
-        <br><br>
-        <table style="width: 100%;">
-            <tr>
-                <td style="width: 50%;">
-                    <p>_____________________<br>
-                    Employee Signature<br>
-                    Date: _____________</p>
-                </td>
-                <td style="width: 50%;">
-                    <p>_____________________<br>
-                    HR/Admin Signature<br>
-                    Date: _____________</p>
-                </td>
-            </tr>
-        </table>
+        return {
+            'to_email': employee.email_personal,
+            'cc_emails': [config.DEFAULT_SENDER_EMAIL, employee.email] if employee.email else [config.DEFAULT_SENDER_EMAIL],
+            'subject': "Asset Return Reminder",
+            'body_html': body_html,
+            'body_text': body_text
+        }
+    
+    def _generate_handover_form_html(self, employee: Employee, assets: List[Asset]) -> str:
+        """Generate HTML for asset handover form"""
+        return "".join(self._iter_handover_form_html(employee, assets))
+    
+    def _iter_handover_form_html(self, employee: Employee, assets: List[Asset]) -> Iterator[str]:
         """
-        
-        return form_html
\ No newline at end of file
+        Stream the asset handover form HTML chunk by chunk
+
+        The employee and assets must stay attached to an open session until
+        the generator is exhausted.
+
+        Args:
+            employee: Employee the form is for
+            assets: Assets to list on the form
+
+        Returns:
+            Iterator over the rendered form, one template chunk at a time
+        """
+        return self._handover_template.generate(
+            employee=employee,
+            assets=assets,
+            status_colors=_STATUS_COLORS,
+            format_date=format_date,
+            today=format_date(date.today())
+        )
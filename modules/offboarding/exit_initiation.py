@@ -1,14 +1,235 @@
+import copy
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+from jinja2 import Template
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, load_only
 from database.connection import get_db_session
-from database.models import Employee, OffboardingChecklist
+from database.models import Employee, OffboardingChecklist, OffboardingNote
 from modules.email.email_Sender import EmailSender
 from config import config
 from utils.helpers import calculate_days_between, format_date
 
 logger = logging.getLogger(__name__)
 
+# Exit emails are delivered off the request thread so SMTP latency does not
+# hold up the exit initiation response
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='exit-email')
+
+# Email bodies are compiled once at import; autoescaping keeps employee and
+# manager names from injecting markup
+_EXIT_CONFIRMATION_HTML = Template("""
+<p>Hi {{ employee.full_name }},</p>
+
+<p>This is to confirm that your last working day at Rapid Innovation is <b>{{ last_working_day }}</b>.</p>
+
+<p>You are requested to please look into the following points:</p>
+
+<ol>
+    <li>Please change all the communication addresses, if any are provided as the company's address.</li>
+    {% if employee.employee_type == 'intern' %}
+    <li>Your invoices will be considered as payslips.</li>
+    {% else %}
+    <li>All your payslips are available on Razorpay; we expect you to download them and take them with you.</li>
+    {% endif %}
+    {% if employee.employee_type == 'full_time' %}
+    <li>Please ensure to submit all company belongings to the people concerned on the last working day,
+    like a laptop, bag, mouse, headphones, and dongle (if any).</li>
+    <li>If you wish to withdraw your PF amount, you can do that on the online PF portal.
+    (People having less than 6 months of experience with us will not be eligible to withdraw the PF amount)</li>
+    {% endif %}
+    <li>Please refer to the following Link to the exit feedback form and submit your valuable feedback
+    on or before your last working day.</li>
+    <li>Also, refer to the {{ 'Internship' if employee.employee_type == 'intern' else 'Appointment' }}
+    Letter signed by you at the time of Joining Rapid Innovation so that you can adhere to all the
+    clauses mentioned in it.</li>
+    <li>Kindly move all the files to a folder in the drive and provide ownership to {{ employee.reporting_manager }}'s mail ID</li>
+</ol>
+
+<p>Your full and final settlement will be processed within 30-45 days from your last working day. HR will be sending the FNF statement to your email ID.</p>
+{% if short_notice %}
+<p><b>Note:</b> As per company policy, the required notice period is {{ required_notice }} days.
+Since you have served a shorter notice period, appropriate recovery may be applicable as per your appointment letter.</p>
+{% endif %}
+<p>Regards<br>
+Team HR<br>
+Rapid Innovation</p>
+""", autoescape=True)
+
+_MANAGER_NOTIFICATION_HTML = Template("""
+<p>Hi {{ employee.reporting_manager }},</p>
+
+<p>I hope you are doing well !!</p>
+
+<p>As you know, the LWD is <b>{{ last_working_day }}</b> as the last working day of
+<b>{{ employee.full_name }}</b>.</p>
+
+<p>Kindly let me know once all his knowledge transfer is done so that I can proceed with his exit formalities.
+These formalities include deactivating his official email ID (once deactivated cannot be restored) and removing
+him from Slack. Kindly let us know if the official mail data has to be transferred to any other account.</p>
+
+<p>Also please take care of any software he is using like the GitHub account, also please remove him from
+project groups.</p>
+
+<p>Please let me know in case of any queries.</p>
+
+<p>Regards,<br>
+Team HR<br>
+Rapid Innovation</p>
+""", autoescape=True)
+
+_MANAGER_APPROVAL_HTML = Template("""
+<p>Dear HR Team,</p>
+
+<p>This is to inform you that {{ approved_by }} has approved the exit process for
+<b>{{ employee.full_name }}</b> ({{ employee.employee_id }}).</p>
+
+<p>Knowledge transfer arrangements have been confirmed. You may proceed with the
+remaining exit formalities.</p>
+
+<p>Employee Details:<br>
+Name: {{ employee.full_name }}<br>
+Employee ID: {{ employee.employee_id }}<br>
+Designation: {{ employee.designation }}<br>
+Department: {{ employee.department }}</p>
+
+<p>Best regards,<br>
+HR System</p>
+""", autoescape=True)
+
+# Employee columns needed to start an exit and work out its notice period
+_EXIT_EMPLOYEE_COLS = (
+    Employee.employee_id, Employee.employee_type, Employee.date_of_joining, Employee.probation_period
+)
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING ... RETURNING
+_UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+# Employee columns read by the exit status payload and the HR approval email
+_SUMMARY_EMPLOYEE_COLS = (
+    Employee.first_name, Employee.last_name, Employee.employee_id,
+    Employee.designation, Employee.department
+)
+
+# Exit status payloads keyed by employee ID; status pages poll this far more
+# often than the checklist changes. Every module that updates a checklist
+# drops the entry through invalidate_exit_status once its change is committed
+EXIT_STATUS_CACHE_TTL_SECONDS = 60
+_exit_status_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+_exit_status_cache_lock = threading.Lock()
+
+
+def _get_cached_exit_status(employee_id: int) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached exit status, or None when missing or expired"""
+    with _exit_status_cache_lock:
+        entry = _exit_status_cache.get(employee_id)
+        if entry is None:
+            return None
+        expires_at, status = entry
+        if expires_at < time.monotonic():
+            del _exit_status_cache[employee_id]
+            return None
+    return copy.deepcopy(status)
+
+
+def _cache_exit_status(employee_id: int, status: Dict[str, Any]):
+    """Remember the exit status for an employee"""
+    with _exit_status_cache_lock:
+        _exit_status_cache[employee_id] = (
+            time.monotonic() + EXIT_STATUS_CACHE_TTL_SECONDS, copy.deepcopy(status)
+        )
+
+
+def invalidate_exit_status(employee_id: int):
+    """Drop the cached exit status after the employee's checklist changes"""
+    with _exit_status_cache_lock:
+        _exit_status_cache.pop(employee_id, None)
+
+# Plain-text counterparts rendered with the same context, so sends do not
+# have to strip the HTML bodies
+_EXIT_CONFIRMATION_TEXT = Template("""Hi {{ employee.full_name }},
+
+This is to confirm that your last working day at Rapid Innovation is {{ last_working_day }}.
+
+You are requested to please look into the following points:
+
+1. Please change all the communication addresses, if any are provided as the company's address.
+{% if employee.employee_type == 'intern' -%}
+2. Your invoices will be considered as payslips.
+{% else -%}
+2. All your payslips are available on Razorpay; we expect you to download them and take them with you.
+{% endif -%}
+{% set n = 3 -%}
+{% if employee.employee_type == 'full_time' -%}
+3. Please ensure to submit all company belongings to the people concerned on the last working day, like a laptop, bag, mouse, headphones, and dongle (if any).
+4. If you wish to withdraw your PF amount, you can do that on the online PF portal. (People having less than 6 months of experience with us will not be eligible to withdraw the PF amount)
+{% set n = 5 -%}
+{% endif -%}
+{{ n }}. Please refer to the following Link to the exit feedback form and submit your valuable feedback on or before your last working day.
+{{ n + 1 }}. Also, refer to the {{ 'Internship' if employee.employee_type == 'intern' else 'Appointment' }} Letter signed by you at the time of Joining Rapid Innovation so that you can adhere to all the clauses mentioned in it.
+{{ n + 2 }}. Kindly move all the files to a folder in the drive and provide ownership to {{ employee.reporting_manager }}'s mail ID
+
+Your full and final settlement will be processed within 30-45 days from your last working day. HR will be sending the FNF statement to your email ID.
+{% if short_notice %}
+Note: As per company policy, the required notice period is {{ required_notice }} days. Since you have served a shorter notice period, appropriate recovery may be applicable as per your appointment letter.
+{% endif %}
+Regards
+Team HR
+Rapid Innovation
+""")
+
+_MANAGER_NOTIFICATION_TEXT = Template("""Hi {{ employee.reporting_manager }},
+
+I hope you are doing well !!
+
+As you know, the LWD is {{ last_working_day }} as the last working day of {{ employee.full_name }}.
+
+Kindly let me know once all his knowledge transfer is done so that I can proceed with his exit formalities. These formalities include deactivating his official email ID (once deactivated cannot be restored) and removing him from Slack. Kindly let us know if the official mail data has to be transferred to any other account.
+
+Also please take care of any software he is using like the GitHub account, also please remove him from project groups.
+
+Please let me know in case of any queries.
+
+Regards,
+Team HR
+Rapid Innovation
+""")
+
+_MANAGER_APPROVAL_TEXT = Template("""Dear HR Team,
+
+This is to inform you that {{ approved_by }} has approved the exit process for {{ employee.full_name }} ({{ employee.employee_id }}).
+
+Knowledge transfer arrangements have been confirmed. You may proceed with the remaining exit formalities.
+
+Employee Details:
+Name: {{ employee.full_name }}
+Employee ID: {{ employee.employee_id }}
+Designation: {{ employee.designation }}
+Department: {{ employee.department }}
+
+Best regards,
+HR System
+""")
+
+@lru_cache(maxsize=8)
+def _notice_days_for(employee_type: str, confirmed: bool) -> int:
+    """Required notice period in days for an employee type and probation state"""
+    if employee_type == 'full_time':
+        return config.NOTICE_PERIOD['full_time']['confirmed' if confirmed else 'probation']
+    
+    elif employee_type == 'intern':
+        return config.NOTICE_PERIOD['intern']
+    
+    else:  # contractor
+        return config.NOTICE_PERIOD['contractor']
+
 class ExitManager:
     """Manage employee exit/offboarding process"""
     
@@ -17,37 +238,58 @@ class ExitManager:
     
     def initiate_exit(self, exit_data: Dict[str, Any]) -> Dict[str, Any]:
         """Initiate exit process for an employee"""
+        email_jobs = []
+        result = self._create_exit(exit_data, email_jobs)
+        
+        # Send exit confirmation and manager notification in the background
+        if email_jobs:
+            _email_executor.submit(self._deliver_exit_emails_batch, email_jobs)
+        
+        return result
+    
+    def initiate_exits(self, exit_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Initiate the exit process for several employees, sending all their emails over one SMTP connection
+
+        Args:
+            exit_data_list: Exit details for each employee, as accepted by initiate_exit()
+
+        Returns:
+            One initiate_exit() style result per entry, in the same order
+        """
+        email_jobs = []
+        results = [self._create_exit(exit_data, email_jobs) for exit_data in exit_data_list]
+        
+        if email_jobs:
+            _email_executor.submit(self._deliver_exit_emails_batch, email_jobs)
+        
+        return results
+    
+    def _create_exit(self, exit_data: Dict[str, Any], email_jobs: List[Tuple]) -> Dict[str, Any]:
+        """Create the offboarding checklist and queue the exit emails onto email_jobs"""
+        # Reject malformed requests before taking a connection from the pool
+        error = self._validate_exit_payload(exit_data)
+        if error:
+            return {
+                'success': False,
+                'message': error
+            }
+        
         try:
             with get_db_session() as session:
                 # Get employee
-                employee = session.query(Employee).filter_by(id=exit_data['employee_id']).first()
+                employee = session.query(Employee).options(
+                    load_only(*_EXIT_EMPLOYEE_COLS)
+                ).filter_by(id=exit_data['employee_id']).first()
                 if not employee:
                     return {
                         'success': False,
                         'message': 'Employee not found'
                     }
                 
-                # Check if employee is already in exit process
-                existing_checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee.id
-                ).first()
-                
-                if existing_checklist:
-                    return {
-                        'success': False,
-                        'message': 'Exit process already initiated for this employee'
-                    }
-                
-                # Validate dates
                 resignation_date = exit_data['resignation_date']
                 last_working_day = exit_data['last_working_day']
                 
-                if last_working_day < resignation_date:
-                    return {
-                        'success': False,
-                        'message': 'Last working day cannot be before resignation date'
-                    }
-                
                 # Check notice period
                 notice_period_days = calculate_days_between(resignation_date, last_working_day)
                 required_notice = self._get_required_notice_period(employee)
@@ -55,34 +297,39 @@ class ExitManager:
                 short_notice = notice_period_days < required_notice
                 
                 # Create offboarding checklist
-                offboarding_checklist = OffboardingChecklist(
-                    employee_id=employee.id,
-                    resignation_date=resignation_date,
-                    last_working_day=last_working_day,
-                    exit_type=exit_data.get('exit_type', 'resignation'),
-                    exit_reason=exit_data.get('exit_reason', ''),
-                    manager_approval=exit_data.get('manager_informed', False),
-                    notes=f"Notice period: {notice_period_days} days (Required: {required_notice} days)"
-                )
+                checklist_values = {
+                    'employee_id': employee.id,
+                    'resignation_date': resignation_date,
+                    'last_working_day': last_working_day,
+                    'exit_type': exit_data.get('exit_type', 'resignation'),
+                    'exit_reason': exit_data.get('exit_reason', ''),
+                    'manager_approval': exit_data.get('manager_informed', False),
+                    'notes': f"Notice period: {notice_period_days} days (Required: {required_notice} days)"
+                }
                 
                 if exit_data.get('manager_informed'):
-                    offboarding_checklist.manager_approval_date = datetime.utcnow()
+                    checklist_values['manager_approval_date'] = datetime.utcnow()
                 
-                session.add(offboarding_checklist)
+                if self._insert_checklist(session, checklist_values) is None:
+                    return {
+                        'success': False,
+                        'message': 'Exit process already initiated for this employee'
+                    }
                 
                 # Update employee status
-                employee.status = 'offboarding'
+                session.execute(
+                    update(Employee).where(Employee.id == employee.id).values(status='offboarding')
+                )
                 
-                session.commit()
+                # Read before commit expires the employee
+                employee_pk, employee_code = employee.id, employee.employee_id
                 
-                # Send exit confirmation emails
-                self._send_exit_confirmation_email(employee, exit_data, short_notice)
+                session.commit()
+                invalidate_exit_status(employee_pk)
                 
-                # Send manager notification if not already informed
-                if not exit_data.get('manager_informed'):
-                    self._send_manager_notification(employee, exit_data)
+                email_jobs.append((employee_pk, dict(exit_data), short_notice, required_notice))
                 
-                logger.info(f"Exit process initiated for employee {employee.employee_id}")
+                logger.info("Exit process initiated for employee %s", employee_code)
                 
                 return {
                     'success': True,
@@ -93,40 +340,97 @@ class ExitManager:
                 }
                 
         except Exception as e:
-            logger.error(f"Error initiating exit: {str(e)}")
+            logger.error("Error initiating exit: %s", e)
             return {
                 'success': False,
                 'message': f'Error initiating exit: {str(e)}'
             }
     
+    @staticmethod
+    def _validate_exit_payload(exit_data: Dict[str, Any]) -> Optional[str]:
+        """Return an error message for missing or inconsistent exit details, or None if they are valid"""
+        if not exit_data.get('employee_id'):
+            return 'Employee ID is required'
+        
+        resignation_date = exit_data.get('resignation_date')
+        last_working_day = exit_data.get('last_working_day')
+        
+        if not resignation_date:
+            return 'Resignation date is required'
+        if not last_working_day:
+            return 'Last working day is required'
+        if not isinstance(resignation_date, date) or not isinstance(last_working_day, date):
+            return 'Resignation date and last working day must be dates'
+        
+        if last_working_day < resignation_date:
+            return 'Last working day cannot be before resignation date'
+        
+        return None
+    
+    @staticmethod
+    def _insert_checklist(session, values: Dict[str, Any]) -> Optional[int]:
+        """
+        Insert an offboarding checklist unless the employee already has one
+
+        Args:
+            session: Open database session
+            values: Column values for the new checklist
+
+        Returns:
+            ID of the new checklist, or None if one already existed
+        """
+        upsert_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if upsert_insert is not None:
+            return session.execute(
+                upsert_insert(OffboardingChecklist)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=['employee_id'])
+                .returning(OffboardingChecklist.id)
+            ).scalar()
+        
+        # Other databases fall back on the unique employee_id index
+        try:
+            with session.begin_nested():
+                return session.execute(
+                    insert(OffboardingChecklist).values(**values)
+                ).inserted_primary_key[0]
+        except IntegrityError:
+            return None
+    
     def approve_manager_confirmation(self, employee_id: int, approved_by: str, 
                                    knowledge_transfer_plan: str = None) -> Dict[str, Any]:
         """Manager approval for exit and knowledge transfer"""
         try:
             with get_db_session() as session:
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
-                
-                if not checklist:
+                # Update manager approval in place; no row back means no checklist
+                checklist_id = self._update_checklist(
+                    session, employee_id,
+                    manager_approval=True, manager_approval_date=datetime.utcnow()
+                )
+                if checklist_id is None:
                     return {
                         'success': False,
                         'message': 'Offboarding checklist not found'
                     }
                 
-                # Update manager approval
-                checklist.manager_approval = True
-                checklist.manager_approval_date = datetime.utcnow()
-                
                 if knowledge_transfer_plan:
-                    existing_notes = checklist.notes or ""
-                    checklist.notes = existing_notes + f"\n\nKnowledge Transfer Plan:\n{knowledge_transfer_plan}"
+                    session.add(OffboardingNote(
+                        checklist_id=checklist_id,
+                        kind='knowledge_transfer_plan',
+                        body=knowledge_transfer_plan
+                    ))
+                
+                # Build the HR confirmation before commit expires the employee
+                employee = session.query(Employee).options(
+                    load_only(*_SUMMARY_EMPLOYEE_COLS)
+                ).filter_by(id=employee_id).first()
+                email_data = self._build_manager_approval_email(employee, approved_by)
                 
                 session.commit()
+                invalidate_exit_status(employee_id)
                 
                 # Send confirmation to HR
-                employee = session.query(Employee).filter_by(id=employee_id).first()
-                self._send_manager_approval_notification(employee, approved_by)
+                self._send_manager_approval_notification(email_data)
                 
                 return {
                     'success': True,
@@ -134,7 +438,7 @@ class ExitManager:
                 }
                 
         except Exception as e:
-            logger.error(f"Error recording manager approval: {str(e)}")
+            logger.error("Error recording manager approval: %s", e)
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
@@ -145,25 +449,26 @@ class ExitManager:
         """Update knowledge transfer completion status"""
         try:
             with get_db_session() as session:
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
+                values = {'knowledge_transfer': completed}
+                if completed:
+                    values['knowledge_transfer_date'] = datetime.utcnow()
                 
-                if not checklist:
+                checklist_id = self._update_checklist(session, employee_id, **values)
+                if checklist_id is None:
                     return {
                         'success': False,
                         'message': 'Offboarding checklist not found'
                     }
                 
-                checklist.knowledge_transfer = completed
-                if completed:
-                    checklist.knowledge_transfer_date = datetime.utcnow()
-                
                 if details:
-                    existing_notes = checklist.notes or ""
-                    checklist.notes = existing_notes + f"\n\nKnowledge Transfer Details:\n{details}"
+                    session.add(OffboardingNote(
+                        checklist_id=checklist_id,
+                        kind='knowledge_transfer',
+                        body=details
+                    ))
                 
                 session.commit()
+                invalidate_exit_status(employee_id)
                 
                 return {
                     'success': True,
@@ -171,17 +476,34 @@ class ExitManager:
                 }
                 
         except Exception as e:
-            logger.error(f"Error updating knowledge transfer: {str(e)}")
+            logger.error("Error updating knowledge transfer: %s", e)
             return {
                 'success': False,
                 'message': f'Error: {str(e)}'
             }
     
+    @staticmethod
+    def _update_checklist(session, employee_id: int, **values) -> Optional[int]:
+        """Update the employee's offboarding checklist and return its primary key, or None if there is none"""
+        return session.execute(
+            update(OffboardingChecklist)
+            .where(OffboardingChecklist.employee_id == employee_id)
+            .values(**values)
+            .returning(OffboardingChecklist.id)
+        ).scalar()
+    
     def get_exit_status(self, employee_id: int) -> Dict[str, Any]:
         """Get current exit status for an employee"""
+        cached = _get_cached_exit_status(employee_id)
+        if cached is not None:
+            return cached
+        
         try:
             with get_db_session() as session:
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+                employee = session.query(Employee).options(
+                    load_only(*_SUMMARY_EMPLOYEE_COLS),
+                    joinedload(Employee.offboarding_checklist).defer(OffboardingChecklist.notes)
+                ).filter_by(id=employee_id).first()
                 if not employee:
                     return {
                         'success': False,
@@ -189,9 +511,7 @@ class ExitManager:
                         'data': None
                     }
                 
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
+                checklist = employee.offboarding_checklist
                 
                 if not checklist:
                     return {
@@ -200,151 +520,197 @@ class ExitManager:
                         'data': None
                     }
                 
-                # Calculate progress
-                tasks = [
-                    checklist.manager_approval,
-                    checklist.knowledge_transfer,
-                    checklist.assets_returned,
-                    checklist.access_revoked,
-                    checklist.fnf_processed,
-                    checklist.experience_letter_issued
-                ]
-                completed_tasks = sum(1 for task in tasks if task)
-                progress_percentage = (completed_tasks / len(tasks)) * 100
-                
-                # Days remaining
-                days_remaining = (checklist.last_working_day - date.today()).days
-                
-                exit_data = {
-                    'employee': {
-                        'name': employee.full_name,
-                        'employee_id': employee.employee_id,
-                        'designation': employee.designation,
-                        'department': employee.department
-                    },
-                    'exit_details': {
-                        'resignation_date': checklist.resignation_date,
-                        'last_working_day': checklist.last_working_day,
-                        'exit_type': checklist.exit_type,
-                        'exit_reason': checklist.exit_reason,
-                        'days_remaining': days_remaining
-                    },
-                    'checklist_status': {
-                        'manager_approval': checklist.manager_approval,
-                        'knowledge_transfer': checklist.knowledge_transfer,
-                        'assets_returned': checklist.assets_returned,
-                        'access_revoked': checklist.access_revoked,
-                        'fnf_processed': checklist.fnf_processed,
-                        'experience_letter_issued': checklist.experience_letter_issued,
-                        'completed': checklist.offboarding_completed
-                    },
-                    'progress': {
-                        'percentage': progress_percentage,
-                        'completed_tasks': completed_tasks,
-                        'total_tasks': len(tasks)
-                    }
-                }
-                
-                return {
+                status = {
                     'success': True,
-                    'data': exit_data
+                    'data': self._build_exit_status(employee, checklist)
                 }
+                _cache_exit_status(employee_id, status)
+                
+                return status
                 
         except Exception as e:
-            logger.error(f"Error getting exit status: {str(e)}")
+            logger.error("Error getting exit status: %s", e)
             return {
                 'success': False,
                 'message': f'Error: {str(e)}',
                 'data': None
             }
     
+    def get_exit_status_many(self, employee_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get exit status for several employees with a single query
+
+        Args:
+            employee_ids: Database IDs of the employees
+
+        Returns:
+            Dict keyed by employee ID, each value shaped like get_exit_status()
+        """
+        try:
+            with get_db_session() as session:
+                employees = session.query(Employee).options(
+                    load_only(*_SUMMARY_EMPLOYEE_COLS),
+                    joinedload(Employee.offboarding_checklist).defer(OffboardingChecklist.notes)
+                ).filter(Employee.id.in_(employee_ids)).all()
+                employees_by_id = {employee.id: employee for employee in employees}
+                today = date.today()
+                
+                statuses = {}
+                for employee_id in employee_ids:
+                    employee = employees_by_id.get(employee_id)
+                    if not employee:
+                        statuses[employee_id] = {
+                            'success': False,
+                            'message': 'Employee not found',
+                            'data': None
+                        }
+                    elif not employee.offboarding_checklist:
+                        statuses[employee_id] = {
+                            'success': False,
+                            'message': 'Exit process not initiated',
+                            'data': None
+                        }
+                    else:
+                        statuses[employee_id] = {
+                            'success': True,
+                            'data': self._build_exit_status(employee, employee.offboarding_checklist, today)
+                        }
+                
+                return statuses
+                
+        except Exception as e:
+            logger.error("Error getting exit statuses: %s", e)
+            return {
+                employee_id: {
+                    'success': False,
+                    'message': f'Error: {str(e)}',
+                    'data': None
+                }
+                for employee_id in employee_ids
+            }
+    
+    def _build_exit_status(self, employee: Employee, checklist: OffboardingChecklist,
+                           today: Optional[date] = None) -> Dict[str, Any]:
+        """Assemble the exit status payload for an employee and their checklist"""
+        # Calculate progress
+        tasks = [
+            checklist.manager_approval,
+            checklist.knowledge_transfer,
+            checklist.assets_returned,
+            checklist.access_revoked,
+            checklist.fnf_processed,
+            checklist.experience_letter_issued
+        ]
+        completed_tasks = sum(1 for task in tasks if task)
+        progress_percentage = (completed_tasks / len(tasks)) * 100
+        
+        # Days remaining
+        days_remaining = (checklist.last_working_day - (today or date.today())).days
+        
+        exit_data = {
+            'employee': {
+                'name': employee.full_name,
+                'employee_id': employee.employee_id,
+                'designation': employee.designation,
+                'department': employee.department
+            },
+            'exit_details': {
+                # ISO strings, so the payload is JSON-ready as built and as cached
+                'resignation_date': self._iso_date(checklist.resignation_date),
+                'last_working_day': self._iso_date(checklist.last_working_day),
+                'exit_type': checklist.exit_type,
+                'exit_reason': checklist.exit_reason,
+                'days_remaining': days_remaining
+            },
+            'checklist_status': {
+                'manager_approval': checklist.manager_approval,
+                'knowledge_transfer': checklist.knowledge_transfer,
+                'assets_returned': checklist.assets_returned,
+                'access_revoked': checklist.access_revoked,
+                'fnf_processed': checklist.fnf_processed,
+                'experience_letter_issued': checklist.experience_letter_issued,
+                'completed': checklist.offboarding_completed
+            },
+            'progress': {
+                'percentage': progress_percentage,
+                'completed_tasks': completed_tasks,
+                'total_tasks': len(tasks)
+            }
+        }
+        
+        return exit_data
+    
+    @staticmethod
+    def _iso_date(value: Optional[date]) -> Optional[str]:
+        """Format a date as an ISO 8601 string, passing None through"""
+        return value.isoformat() if value else None
+    
     def _get_required_notice_period(self, employee: Employee) -> int:
         """Get required notice period in days based on employee type and status"""
+        return _notice_days_for(*self._classify_employee(employee))
+    
+    @staticmethod
+    def _classify_employee(employee: Employee) -> Tuple[str, bool]:
+        """Return the employee type and whether they have completed probation"""
         employee_type = employee.employee_type
         
-        if employee_type == 'full_time':
-            # Check if employee is confirmed (past probation)
-            if employee.date_of_joining:
-                months_worked = (date.today() - employee.date_of_joining).days / 30
-                probation_months = employee.probation_period or config.PROBATION_PERIOD['full_time']
-                
-                if months_worked > probation_months:
-                    return config.NOTICE_PERIOD['full_time']['confirmed']
-                else:
-                    return config.NOTICE_PERIOD['full_time']['probation']
-            else:
-                return config.NOTICE_PERIOD['full_time']['confirmed']
+        # Only full-time employees serve a probation-dependent notice period;
+        # without a joining date they are treated as confirmed
+        if employee_type != 'full_time' or not employee.date_of_joining:
+            return employee_type, True
         
-        elif employee_type == 'intern':
-            return config.NOTICE_PERIOD['intern']
+        # Probation is counted in 30-day months
+        probation_days = (employee.probation_period or config.PROBATION_PERIOD['full_time']) * 30
+        days_worked = (date.today() - employee.date_of_joining).days
         
-        else:  # contractor
-            return config.NOTICE_PERIOD['contractor']
+        return employee_type, days_worked > probation_days
+    
+    def _deliver_exit_emails_batch(self, email_jobs: List[Tuple]):
+        """Send the exit emails for each queued exit over a single SMTP connection"""
+        with self.email_sender.smtp_connection():
+            for job in email_jobs:
+                self._deliver_exit_emails(*job)
+    
+    def _deliver_exit_emails(self, employee_id: int, exit_data: Dict[str, Any], short_notice: bool,
+                             required_notice: int):
+        """Load the employee in a fresh session and send the exit emails"""
+        try:
+            with get_db_session() as session:
+                employee = session.query(Employee).filter_by(id=employee_id).first()
+                if not employee:
+                    logger.warning("Employee %s not found for exit emails", employee_id)
+                    return
+                
+                self._send_exit_confirmation_email(employee, exit_data, short_notice, required_notice)
+                
+                # Send manager notification if not already informed
+                if not exit_data.get('manager_informed'):
+                    self._send_manager_notification(employee, exit_data)
+                
+        except Exception as e:
+            # Background task: nothing above us would report this
+            logger.exception("Unexpected error delivering exit emails: %s", e)
     
     def _send_exit_confirmation_email(self, employee: Employee, exit_data: Dict[str, Any], 
-                                    short_notice: bool):
+                                    short_notice: bool, required_notice: int):
         """Send exit confirmation email to employee"""
         try:
             subject = f"Exit Formalities - {employee.full_name} - LWD"
             
-            # Determine employee type for email content
-            if employee.employee_type == 'intern':
-                payslip_info = "Your invoices will be considered as payslips."
-                settlement_timeline = "Your full and final settlement will be processed within 30-45 days from your last working day."
-            else:
-                payslip_info = "All your payslips are available on Razorpay; we expect you to download them and take them with you."
-                settlement_timeline = "Your full and final settlement will be processed within 30-45 days from your last working day."
-                
-            body_html = f"""
-            <p>Hi {employee.full_name},</p>
-            
-            <p>This is to confirm that your last working day at Rapid Innovation is <b>{format_date(exit_data['last_working_day'])}</b>.</p>
-            
-            <p>You are requested to please look into the following points:</p>
-            
-            <ol>
-                <li>Please change all the communication addresses, if any are provided as the company's address.</li>
-                <li>{payslip_info}</li>
-            """
-            
-            if employee.employee_type == 'full_time':
-                body_html += """
-                <li>Please ensure to submit all company belongings to the people concerned on the last working day, 
-                like a laptop, bag, mouse, headphones, and dongle (if any).</li>
-                <li>If you wish to withdraw your PF amount, you can do that on the online PF portal. 
-                (People having less than 6 months of experience with us will not be eligible to withdraw the PF amount)</li>
-                """
-            
-            body_html += f"""
-                <li>Please refer to the following Link to the exit feedback form and submit your valuable feedback 
-                on or before your last working day.</li>
-                <li>Also, refer to the {'Internship' if employee.employee_type == 'intern' else 'Appointment'}
-                Letter signed by you at the time of Joining Rapid Innovation so that you can adhere to all the 
-                clauses mentioned in it.</li>
-                <li>Kindly move all the files to a folder in the drive and provide ownership to {employee.reporting_manager}'s mail ID</li>
-            </ol>
-            
-            <p>{settlement_timeline} HR will be sending the FNF statement to your email ID.</p>
-            """
-            
-            if short_notice:
-                body_html += f"""
-                <p><b>Note:</b> As per company policy, the required notice period is {self._get_required_notice_period(employee)} days. 
-                Since you have served a shorter notice period, appropriate recovery may be applicable as per your appointment letter.</p>
-                """
-            
-            body_html += """
-            <p>Regards<br>
-            Team HR<br>
-            Rapid Innovation</p>
-            """
+            context = {
+                'employee': employee,
+                'last_working_day': format_date(exit_data['last_working_day']),
+                'short_notice': short_notice,
+                'required_notice': required_notice
+            }
+            body_html = _EXIT_CONFIRMATION_HTML.render(context)
             
             email_data = {
                 'to_email': employee.email or employee.email_personal,
                 'cc_emails': [config.DEFAULT_SENDER_EMAIL],
                 'subject': subject,
                 'body_html': body_html,
-                'body_text': self.email_sender._html_to_text(body_html)
+                'body_text': _EXIT_CONFIRMATION_TEXT.render(context)
             }
             
             result = self.email_sender.send_email(email_data)
@@ -360,44 +726,30 @@ class ExitManager:
                 )
             
         except Exception as e:
-            logger.error(f"Error sending exit confirmation email: {str(e)}")
+            logger.error("Error sending exit confirmation email: %s", e)
     
     def _send_manager_notification(self, employee: Employee, exit_data: Dict[str, Any]):
         """Send notification to manager about employee exit"""
         try:
             subject = f"Confirmation for proceeding with the Exit formalities - {employee.full_name}"
             
-            body_html = f"""
-            <p>Hi {employee.reporting_manager},</p>
-            
-            <p>I hope you are doing well !!</p>
-            
-            <p>As you know, the LWD is <b>{format_date(exit_data['last_working_day'])}</b> as the last working day of 
-            <b>{employee.full_name}</b>.</p>
-            
-            <p>Kindly let me know once all his knowledge transfer is done so that I can proceed with his exit formalities. 
-            These formalities include deactivating his official email ID (once deactivated cannot be restored) and removing 
-            him from Slack. Kindly let us know if the official mail data has to be transferred to any other account.</p>
-            
-            <p>Also please take care of any software he is using like the GitHub account, also please remove him from 
-            project groups.</p>
-            
-            <p>Please let me know in case of any queries.</p>
-            
-            <p>Regards,<br>
-            Team HR<br>
-            Rapid Innovation</p>
-            """
-            
-            # In production, get manager's email from database
-            manager_email = f"{employee.reporting_manager.lower().replace(' ', '.')}@rapidinnovation.com"
+            context = {
+                'employee': employee,
+                'last_working_day': format_date(exit_data['last_working_day'])
+            }
+            body_html = _MANAGER_NOTIFICATION_HTML.render(context)
             
+            manager_email = self._get_manager_email(employee)
+            if not manager_email:
+                logger.warning("No manager email for employee %s, skipping manager notification", employee.id)
+                return
+
             email_data = {
                 'to_email': manager_email,
                 'cc_emails': [config.DEFAULT_SENDER_EMAIL],
                 'subject': subject,
                 'body_html': body_html,
-                'body_text': self.email_sender._html_to_text(body_html)
+                'body_text': _MANAGER_NOTIFICATION_TEXT.render(context)
             }
             
             result = self.email_sender.send_email(email_data)
@@ -413,40 +765,35 @@ class ExitManager:
                 )
             
         except Exception as e:
-            logger.error(f"Error sending manager notification: {str(e)}")
+            logger.error("Error sending manager notification: %s", e)
     
-    def _send_manager_approval_notification(self, employee: Employee, approved_by: str):
+    @staticmethod
+    def _get_manager_email(employee: Employee) -> Optional[str]:
+        """Return the manager's email stored on the employee row, deriving it from the name as a fallback"""
+        if employee.manager_email:
+            return employee.manager_email
+        if employee.reporting_manager:
+            return f"{employee.reporting_manager.lower().replace(' ', '.')}@rapidinnovation.com"
+        return None
+    
+    def _build_manager_approval_email(self, employee: Employee, approved_by: str) -> Dict[str, Any]:
+        """Build the HR notification about manager approval"""
+        subject = f"Manager Approval Received - Exit Process - {employee.full_name}"
+        
+        context = {'employee': employee, 'approved_by': approved_by}
+        body_html = _MANAGER_APPROVAL_HTML.render(context)
+        
+        return {
+            'to_email': config.DEFAULT_SENDER_EMAIL,
+            'subject': subject,
+            'body_html': body_html,
+            'body_text': _MANAGER_APPROVAL_TEXT.render(context)
+        }
+    
+    def _send_manager_approval_notification(self, email_data: Dict[str, Any]):
         """Send notification to HR about manager approval"""
         try:
-            subject = f"Manager Approval Received - Exit Process - {employee.full_name}"
-            
-            body_html = f"""
-            <p>Dear HR Team,</p>
-            
-            <p>This is to inform you that {approved_by} has approved the exit process for 
-            <b>{employee.full_name}</b> ({employee.employee_id}).</p>
-            
-            <p>Knowledge transfer arrangements have been confirmed. You may proceed with the 
-            remaining exit formalities.</p>
-            
-            <p>Employee Details:<br>
-            Name: {employee.full_name}<br>
-            Employee ID: {employee.employee_id}<br>
-            Designation: {employee.designation}<br>
-            Department: {employee.department}</p>
-            
-            <p>Best regards,<br>
-            HR System</p>
-            """
-            
-            email_data = {
-                'to_email': config.DEFAULT_SENDER_EMAIL,
-                'subject': subject,
-                'body_html': body_html,
-                'body_text': self.email_sender._html_to_text(body_html)
-            }
-            
             self.email_sender.send_email(email_data)
             
         except Exception as e:
-            logger.error(f"Error sending manager approval notification: {str(e)}")
\ No newline at end of file
+            logger.error("Error sending manager approval notification: %s", e)
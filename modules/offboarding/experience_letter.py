@@ -1,108 +1,182 @@
+import io
+import itertools
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from sqlalchemy import update
+from sqlalchemy.orm import joinedload
 from database.connection import get_db_session
 from database.models import Employee, OffboardingChecklist, EmployeeType
 from modules.email.email_Sender import EmailSender
+from modules.offboarding.exit_initiation import invalidate_exit_status
 from config import config
 from utils.helpers import format_date
 
 logger = logging.getLogger(__name__)
 
+# Letter emails are delivered off the request thread so SMTP latency does not
+# hold up letter generation
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='letter-email')
+
+# Letter paragraphs are fixed markup; only the employee fields change per letter
+_FULLTIME_BODY_TMPL = (
+    "This is to certify that <b>Mr/Ms. {employee_name}</b> worked as the "
+    "<b>{designation}</b> with <b>{company_name}</b> from "
+    "<b>{joining_date}</b> to <b>{leaving_date}</b>."
+)
+_CONTRACTOR_BODY_TMPL = (
+    "This is to certify that <b>Mr/Ms. {employee_name}</b> worked as a "
+    "<b>{designation} (Contractor)</b> with <b>{company_name}</b> "
+    "from <b>{joining_date}</b> to <b>{leaving_date}</b>."
+)
+_EXPERIENCE_PERFORMANCE_TMPL = (
+    "During {gender_pronoun} employment with Rapid Innovation, we found "
+    "{gender_pronoun} performance to be satisfactory."
+)
+_EXPERIENCE_WISHES_TMPL = "We wish {gender_pronoun} success in {gender_pronoun} future endeavors."
+_DUES_SETTLED_TEXT = "All dues are settled."
+_DUES_PENDING_TEXT = "All dues are not settled."
+
+_INTERNSHIP_BODY_TMPL = (
+    "This letter is to certify that <b>Mr/Ms. {employee_name}</b> has completed "
+    "{gender_pronoun} internship with <b>{company_name}</b>. "
+    "{gender_subject_cap} internship tenure was from <b>{joining_date}</b> "
+    "to <b>{leaving_date}</b>. {gender_subject_cap} was working with us "
+    "as an <b>{designation}</b> and was actively & diligently involved in the projects "
+    "and tasks assigned to {gender_pronoun}."
+)
+_INTERNSHIP_PERFORMANCE_TMPL = "During this time, we found {gender_pronoun} to be punctual and hardworking."
+_INTERNSHIP_WISHES_TMPL = "We wish {gender_pronoun} a bright future."
+
+@lru_cache(maxsize=1024)
+def _format_tenure(start_date: date, end_date: date) -> str:
+    """Length of service as text, e.g. '2 years and 3 months'"""
+    # Calculate years and months of service
+    total_days = (end_date - start_date).days
+    years = total_days // 365
+    months = (total_days % 365) // 30
+    
+    tenure_text = ""
+    if years > 0:
+        tenure_text = f"{years} year{'s' if years > 1 else ''}"
+    if months > 0:
+        if tenure_text:
+            tenure_text += f" and {months} month{'s' if months > 1 else ''}"
+        else:
+            tenure_text = f"{months} month{'s' if months > 1 else ''}"
+    
+    return tenure_text
+
 class ExperienceLetterGenerator:
     """Generate experience letters and internship certificates"""
     
     def __init__(self):
         self.email_sender = EmailSender()
         
+        # Paragraph styles are only read while building, so one set serves every letter
+        self.styles = self._initialize_styles()
+        
+        # The logo flowable keeps its decoded image, so the PNG is read once
+        # rather than for every letter
+        logo_path = os.path.join('static', 'images', 'company_logo.png')
+        self.logo = Image(logo_path, width=2*inch, height=0.75*inch) if os.path.exists(logo_path) else None
+        
         # Create output directory
         self.output_dir = os.path.join(config.UPLOAD_FOLDER, 'experience_letters')
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
     
+    def _initialize_styles(self) -> Dict[str, ParagraphStyle]:
+        """Initialize the paragraph styles shared by all letters"""
+        # Built directly rather than from getSampleStyleSheet(), whose other styles
+        # are never used; titles keep Heading1's font and leading
+        return {
+            'ExperienceTitle': ParagraphStyle(
+                'CustomTitle',
+                fontName='Helvetica-Bold',
+                fontSize=16,
+                leading=22,
+                textColor=colors.HexColor('#0066CC'),
+                alignment=TA_CENTER,
+                spaceAfter=30
+            ),
+            'InternshipTitle': ParagraphStyle(
+                'CustomTitle',
+                fontName='Helvetica-Bold',
+                fontSize=18,
+                leading=22,
+                textColor=colors.HexColor('#0066CC'),
+                alignment=TA_CENTER,
+                spaceAfter=40
+            ),
+            'CustomNormal': ParagraphStyle(
+                'CustomNormal',
+                fontName='Helvetica',
+                fontSize=11,
+                alignment=TA_JUSTIFY,
+                spaceAfter=12,
+                leading=16
+            )
+        }
+    
     def generate_experience_letter(self, employee_id: int, dues_settled: bool = True) -> Dict[str, Any]:
         """Generate experience letter or internship certificate"""
         try:
             with get_db_session() as session:
-                # Get employee
-                employee = session.query(Employee).filter_by(id=employee_id).first()
+                # Get employee together with the offboarding checklist
+                employee = session.query(Employee).options(
+                    joinedload(Employee.offboarding_checklist)
+                ).filter_by(id=employee_id).first()
                 if not employee:
                     return {
                         'success': False,
                         'message': 'Employee not found'
                     }
                 
-                # Check if employee has exited
-                if employee.status.value not in ['offboarding', 'exited']:
-                    return {
-                        'success': False,
-                        'message': 'Experience letter can only be generated for exited employees'
-                    }
-                
-                # Get offboarding checklist
-                checklist = session.query(OffboardingChecklist).filter_by(
-                    employee_id=employee_id
-                ).first()
+                checklist = employee.offboarding_checklist
                 
-                if not checklist:
+                error = self._check_prerequisites(employee, checklist, dues_settled)
+                if error:
                     return {
                         'success': False,
-                        'message': 'Offboarding checklist not found'
+                        'message': error
                     }
                 
-                # Check prerequisites based on employee type
-                if employee.employee_type == EmployeeType.FULL_TIME:
-                    # For full-time employees, check FnF and assets
-                    if not dues_settled and (not checklist.fnf_processed or not checklist.assets_returned):
-                        return {
-                            'success': False,
-                            'message': 'All dues must be settled before generating experience letter'
-                        }
-                
-                # Prepare template data
-                template_data = self._prepare_experience_data(employee, checklist, dues_settled)
+                pdf = self._generate_pdf(employee, checklist, dues_settled)
                 
-                # Generate PDF
-                if employee.employee_type == EmployeeType.INTERN:
-                    pdf_path = self._generate_internship_certificate(employee, template_data)
-                else:
-                    pdf_path = self._generate_experience_letter_pdf(employee, template_data, dues_settled)
-                
-                if not pdf_path:
+                if not pdf:
                     return {
                         'success': False,
                         'message': 'Failed to generate experience letter PDF'
                     }
                 
+                pdf_path, pdf_data = pdf
+                
                 # Update offboarding checklist
                 checklist.experience_letter_issued = True
                 checklist.experience_letter_date = datetime.utcnow()
                 session.commit()
+                invalidate_exit_status(employee_id)
                 
-                # Send experience letter email
-                email_result = self._send_experience_letter_email(employee, pdf_path)
+                # Send experience letter email in the background
+                _email_executor.submit(self._deliver_letter_emails, [(employee_id, pdf_path, pdf_data)])
                 
-                if email_result['success']:
-                    logger.info(f"Experience letter generated and sent for employee {employee.employee_id}")
-                    
-                    return {
-                        'success': True,
-                        'message': 'Experience letter generated and sent successfully',
-                        'pdf_path': pdf_path
-                    }
-                else:
-                    return {
-                        'success': True,
-                        'message': 'Experience letter generated but email failed',
-                        'pdf_path': pdf_path
-                    }
+                logger.info(f"Experience letter generated for employee {employee_id}")
+                
+                return {
+                    'success': True,
+                    'message': 'Experience letter generated; email is being sent',
+                    'pdf_path': pdf_path
+                }
                 
         except Exception as e:
             logger.error(f"Error generating experience letter: {str(e)}")
@@ -111,6 +185,158 @@ class ExperienceLetterGenerator:
                 'message': f'Error generating experience letter: {str(e)}'
             }
     
+    def generate_experience_letters_batch(self, employee_ids: List[int],
+                                          dues_settled: bool = True) -> Dict[int, Dict[str, Any]]:
+        """
+        Generate experience letters for several employees at once and queue their emails
+
+        Args:
+            employee_ids: Database IDs of the employees
+            dues_settled: Whether all dues are settled, as for generate_experience_letter()
+
+        Returns:
+            Dict keyed by employee ID, each value shaped like generate_experience_letter()
+        """
+        results = {}
+        eligible = []
+        jobs = []
+        
+        # One timestamp per batch; the sequence keeps filenames unique within it
+        batch_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        sequence = itertools.count()
+        checklist_ids = []
+        generated = []
+        
+        try:
+            with get_db_session() as session:
+                employees = session.query(Employee).options(
+                    joinedload(Employee.offboarding_checklist)
+                ).filter(Employee.id.in_(employee_ids)).all()
+                employees_by_id = {employee.id: employee for employee in employees}
+                
+                for employee_id in employee_ids:
+                    employee = employees_by_id.get(employee_id)
+                    if not employee:
+                        results[employee_id] = {
+                            'success': False,
+                            'message': 'Employee not found'
+                        }
+                        continue
+                    
+                    checklist = employee.offboarding_checklist
+                    error = self._check_prerequisites(employee, checklist, dues_settled)
+                    if error:
+                        results[employee_id] = {
+                            'success': False,
+                            'message': error
+                        }
+                        continue
+                    
+                    eligible.append((employee_id, checklist.id))
+                    jobs.append((
+                        employee.employee_type,
+                        self._prepare_experience_data(employee, checklist, dues_settled),
+                        dues_settled,
+                        f"{batch_stamp}_{next(sequence)}"
+                    ))
+            
+            # Render outside the session so no connection sits idle in a
+            # transaction while the PDFs are built
+            for (employee_id, checklist_id), pdf in zip(eligible, self._render_pdfs(jobs)):
+                if not pdf:
+                    results[employee_id] = {
+                        'success': False,
+                        'message': 'Failed to generate experience letter PDF'
+                    }
+                    continue
+                
+                checklist_ids.append(checklist_id)
+                generated.append((employee_id, *pdf))
+            
+            # Mark every issued letter in one UPDATE
+            if checklist_ids:
+                with get_db_session() as session:
+                    session.execute(
+                        update(OffboardingChecklist)
+                        .where(OffboardingChecklist.id.in_(checklist_ids))
+                        .values(experience_letter_issued=True, experience_letter_date=datetime.utcnow())
+                    )
+                    session.commit()
+            
+            for employee_id, pdf_path, _ in generated:
+                invalidate_exit_status(employee_id)
+                results[employee_id] = {
+                    'success': True,
+                    'message': 'Experience letter generated; email is being sent',
+                    'pdf_path': pdf_path
+                }
+            
+            # Send every letter in the background over one SMTP connection
+            if generated:
+                _email_executor.submit(self._deliver_letter_emails, generated)
+            
+            logger.info(f"Generated {len(generated)} of {len(employee_ids)} experience letters")
+            
+            return {employee_id: results[employee_id] for employee_id in employee_ids}
+            
+        except Exception as e:
+            logger.error(f"Error generating experience letters: {str(e)}")
+            for employee_id in employee_ids:
+                results.setdefault(employee_id, {
+                    'success': False,
+                    'message': f'Error generating experience letter: {str(e)}'
+                })
+            return results
+    
+    def _render_pdfs(self, jobs: List[tuple]) -> List[Optional[Tuple[str, bytes]]]:
+        """Render letter PDFs in worker processes, one per _render_pdf() argument tuple"""
+        if len(jobs) < 2:
+            return [self._render_pdf(*job) for job in jobs]
+        
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_letter_worker,
+                                     initargs=(self.output_dir,)) as pool:
+                return list(pool.map(_letter_worker, jobs))
+                
+        except Exception as e:
+            logger.exception(f"Error rendering letters in parallel, falling back to serial: {str(e)}")
+            return [self._render_pdf(*job) for job in jobs]
+    
+    def _check_prerequisites(self, employee: Employee, checklist: Optional[OffboardingChecklist],
+                             dues_settled: bool) -> Optional[str]:
+        """Return why a letter cannot be issued to the employee yet, or None if it can"""
+        # Check if employee has exited
+        if employee.status not in ['offboarding', 'exited']:
+            return 'Experience letter can only be generated for exited employees'
+        
+        if not checklist:
+            return 'Offboarding checklist not found'
+        
+        # Check prerequisites based on employee type
+        if employee.employee_type == EmployeeType.FULL_TIME.value:
+            # For full-time employees, check FnF and assets
+            if not dues_settled and (not checklist.fnf_processed or not checklist.assets_returned):
+                return 'All dues must be settled before generating experience letter'
+        
+        return None
+    
+    def _generate_pdf(self, employee: Employee, checklist: OffboardingChecklist,
+                      dues_settled: bool) -> Optional[Tuple[str, bytes]]:
+        """Generate the experience letter or internship certificate PDF for the employee"""
+        # Prepare template data
+        template_data = self._prepare_experience_data(employee, checklist, dues_settled)
+        
+        return self._render_pdf(employee.employee_type, template_data, dues_settled)
+    
+    def _render_pdf(self, employee_type: str, template_data: Dict[str, Any],
+                    dues_settled: bool, file_stamp: Optional[str] = None) -> Optional[Tuple[str, bytes]]:
+        """Build the letter PDF from prepared template data; needs no database objects"""
+        if employee_type == EmployeeType.INTERN.value:
+            return self._generate_internship_certificate(template_data, file_stamp)
+        return self._generate_experience_letter_pdf(employee_type, template_data, dues_settled, file_stamp)
+    
     def _prepare_experience_data(self, employee: Employee, checklist: OffboardingChecklist, 
                                 dues_settled: bool) -> Dict[str, Any]:
         """Prepare data for experience letter template"""
@@ -122,19 +348,8 @@ class ExperienceLetterGenerator:
         joining_date = format_date(start_date)
         leaving_date = format_date(end_date)
         
-        # Calculate years and months of service
-        total_days = (end_date - start_date).days
-        years = total_days // 365
-        months = (total_days % 365) // 30
-        
-        tenure_text = ""
-        if years > 0:
-            tenure_text = f"{years} year{'s' if years > 1 else ''}"
-        if months > 0:
-            if tenure_text:
-                tenure_text += f" and {months} month{'s' if months > 1 else ''}"
-            else:
-                tenure_text = f"{months} month{'s' if months > 1 else ''}"
+        # Batches often share joining and leaving dates, so the text is memoized
+        tenure_text = _format_tenure(start_date, end_date)
         
         template_data = {
             'company_name': config.COMPANY_NAME,
@@ -157,58 +372,32 @@ class ExperienceLetterGenerator:
         }
         
         # Add internship-specific data
-        if employee.employee_type == EmployeeType.INTERN:
+        if employee.employee_type == EmployeeType.INTERN.value:
             template_data['internship_duration'] = tenure_text
             template_data['project_details'] = checklist.notes or "various projects"
         
         return template_data
     
-    def _generate_experience_letter_pdf(self, employee: Employee, template_data: Dict[str, Any], 
-                                       dues_settled: bool) -> Optional[str]:
+    def _generate_experience_letter_pdf(self, employee_type: str, template_data: Dict[str, Any], 
+                                       dues_settled: bool,
+                                       file_stamp: Optional[str] = None) -> Optional[Tuple[str, bytes]]:
         """Generate PDF experience letter for full-time employees and contractors"""
         try:
-            # Create filename
-            filename = f"experience_letter_{employee.employee_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            # Create filename; batches pass a shared timestamp plus sequence number
+            file_stamp = file_stamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"experience_letter_{template_data['employee_id']}_{file_stamp}.pdf"
             pdf_path = os.path.join(self.output_dir, filename)
             
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                pdf_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
             # Container for the 'Flowable' objects
             elements = []
             
             # Styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                textColor=colors.HexColor('#0066CC'),
-                alignment=TA_CENTER,
-                spaceAfter=30
-            )
-            
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontSize=11,
-                alignment=TA_JUSTIFY,
-                spaceAfter=12,
-                leading=16
-            )
+            title_style = self.styles['ExperienceTitle']
+            normal_style = self.styles['CustomNormal']
             
             # Add company logo if exists
-            logo_path = os.path.join('static', 'images', 'company_logo.png')
-            if os.path.exists(logo_path):
-                logo = Image(logo_path, width=2*inch, height=0.75*inch)
-                elements.append(logo)
+            if self.logo:
+                elements.append(self.logo)
                 elements.append(Spacer(1, 20))
             
             # Title
@@ -224,44 +413,26 @@ class ExperienceLetterGenerator:
             elements.append(Spacer(1, 20))
             
             # Main content
-            if employee.employee_type == EmployeeType.FULL_TIME:
-                content = f"""
-                This is to certify that <b>Mr/Ms. {template_data['employee_name']}</b> worked as the 
-                <b>{template_data['designation']}</b> with <b>{template_data['company_name']}</b> from 
-                <b>{template_data['joining_date']}</b> to <b>{template_data['leaving_date']}</b>.
-                """
+            if employee_type == EmployeeType.FULL_TIME.value:
+                content = _FULLTIME_BODY_TMPL.format_map(template_data)
             else:  # Contractor
-                content = f"""
-                This is to certify that <b>Mr/Ms. {template_data['employee_name']}</b> worked as a 
-                <b>{template_data['designation']} (Contractor)</b> with <b>{template_data['company_name']}</b> 
-                from <b>{template_data['joining_date']}</b> to <b>{template_data['leaving_date']}</b>.
-                """
+                content = _CONTRACTOR_BODY_TMPL.format_map(template_data)
             
             elements.append(Paragraph(content, normal_style))
             elements.append(Spacer(1, 20))
             
             # Performance statement
-            performance = f"""
-            During {template_data['gender_pronoun']} employment with Rapid Innovation, we found 
-            {template_data['gender_pronoun']} performance to be satisfactory.
-            """
+            performance = _EXPERIENCE_PERFORMANCE_TMPL.format_map(template_data)
             elements.append(Paragraph(performance, normal_style))
             elements.append(Spacer(1, 20))
             
             # Dues statement
-            if dues_settled:
-                dues_text = "All dues are settled."
-            else:
-                dues_text = "All dues are not settled."
-            
+            dues_text = _DUES_SETTLED_TEXT if dues_settled else _DUES_PENDING_TEXT
             elements.append(Paragraph(dues_text, normal_style))
             elements.append(Spacer(1, 20))
             
             # Wishes
-            wishes = f"""
-            We wish {template_data['gender_pronoun']} success in {template_data['gender_pronoun']} 
-            future endeavors.
-            """
+            wishes = _EXPERIENCE_WISHES_TMPL.format_map(template_data)
             elements.append(Paragraph(wishes, normal_style))
             elements.append(Spacer(1, 40))
             
@@ -274,59 +445,31 @@ class ExperienceLetterGenerator:
             elements.append(Paragraph(template_data['hr_manager_designation'], normal_style))
             
             # Build PDF
-            doc.build(elements)
-            
-            return pdf_path
+            return pdf_path, self._build_pdf(pdf_path, elements)
             
         except Exception as e:
             logger.error(f"Error generating experience letter PDF: {str(e)}")
             return None
     
-    def _generate_internship_certificate(self, employee: Employee, template_data: Dict[str, Any]) -> Optional[str]:
+    def _generate_internship_certificate(self, template_data: Dict[str, Any],
+                                         file_stamp: Optional[str] = None) -> Optional[Tuple[str, bytes]]:
         """Generate PDF internship certificate"""
         try:
-            # Create filename
-            filename = f"internship_certificate_{employee.employee_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            # Create filename; batches pass a shared timestamp plus sequence number
+            file_stamp = file_stamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"internship_certificate_{template_data['employee_id']}_{file_stamp}.pdf"
             pdf_path = os.path.join(self.output_dir, filename)
             
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                pdf_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
             # Container for the 'Flowable' objects
             elements = []
             
             # Styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                textColor=colors.HexColor('#0066CC'),
-                alignment=TA_CENTER,
-                spaceAfter=40
-            )
-            
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontSize=11,
-                alignment=TA_JUSTIFY,
-                spaceAfter=12,
-                leading=16
-            )
+            title_style = self.styles['InternshipTitle']
+            normal_style = self.styles['CustomNormal']
             
             # Add company logo if exists
-            logo_path = os.path.join('static', 'images', 'company_logo.png')
-            if os.path.exists(logo_path):
-                logo = Image(logo_path, width=2*inch, height=0.75*inch)
-                elements.append(logo)
+            if self.logo:
+                elements.append(self.logo)
                 elements.append(Spacer(1, 20))
             
             # Title
@@ -342,29 +485,17 @@ class ExperienceLetterGenerator:
             elements.append(Spacer(1, 20))
             
             # Main content
-            content = f"""
-            This letter is to certify that <b>Mr/Ms. {template_data['employee_name']}</b> has completed 
-            {template_data['gender_pronoun']} internship with <b>{template_data['company_name']}</b>. 
-            {template_data['gender_subject_cap']} internship tenure was from <b>{template_data['joining_date']}</b> 
-            to <b>{template_data['leaving_date']}</b>. {template_data['gender_subject_cap']} was working with us 
-            as an <b>{template_data['designation']}</b> and was actively & diligently involved in the projects 
-            and tasks assigned to {template_data['gender_pronoun']}.
-            """
-            
+            content = _INTERNSHIP_BODY_TMPL.format_map(template_data)
             elements.append(Paragraph(content, normal_style))
             elements.append(Spacer(1, 20))
             
             # Performance statement
-            performance = f"""
-            During this time, we found {template_data['gender_pronoun']} to be punctual and hardworking.
-            """
+            performance = _INTERNSHIP_PERFORMANCE_TMPL.format_map(template_data)
             elements.append(Paragraph(performance, normal_style))
             elements.append(Spacer(1, 20))
             
             # Wishes
-            wishes = f"""
-            We wish {template_data['gender_pronoun']} a bright future.
-            """
+            wishes = _INTERNSHIP_WISHES_TMPL.format_map(template_data)
             elements.append(Paragraph(wishes, normal_style))
             elements.append(Spacer(1, 40))
             
@@ -377,19 +508,63 @@ class ExperienceLetterGenerator:
             elements.append(Paragraph(template_data['hr_manager_designation'], normal_style))
             
             # Build PDF
-            doc.build(elements)
-            
-            return pdf_path
+            return pdf_path, self._build_pdf(pdf_path, elements)
             
         except Exception as e:
             logger.error(f"Error generating internship certificate PDF: {str(e)}")
             return None
     
-    def _send_experience_letter_email(self, employee: Employee, pdf_path: str) -> Dict[str, Any]:
+    def _build_pdf(self, pdf_path: str, elements: List[Any]) -> bytes:
+        """Build the PDF in memory, write it to pdf_path in one go and return its bytes"""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
+        doc.build(elements)
+        
+        # The same bytes are attached to the email, so the file is never read back
+        pdf_data = buffer.getvalue()
+        with open(pdf_path, 'wb') as pdf_file:
+            pdf_file.write(pdf_data)
+        
+        return pdf_data
+    
+    def _deliver_letter_emails(self, letters: List[Tuple[int, str, bytes]]):
+        """Load the employees in a fresh session and email each (employee ID, PDF path, PDF bytes) letter"""
+        try:
+            with get_db_session() as session:
+                employees = session.query(Employee).filter(
+                    Employee.id.in_([employee_id for employee_id, _, _ in letters])
+                ).all()
+                employees_by_id = {employee.id: employee for employee in employees}
+                
+                # Share one SMTP connection across the letters
+                with self.email_sender.smtp_connection():
+                    for employee_id, pdf_path, pdf_data in letters:
+                        employee = employees_by_id.get(employee_id)
+                        if not employee:
+                            logger.warning(f"Employee {employee_id} not found for experience letter email")
+                            continue
+                        
+                        result = self._send_experience_letter_email(employee, pdf_path, pdf_data)
+                        if not result['success']:
+                            logger.warning(f"Experience letter email failed for employee {employee.employee_id}")
+                
+        except Exception as e:
+            # Background task: nothing above us would report this
+            logger.exception(f"Unexpected error delivering experience letter emails: {str(e)}")
+    
+    def _send_experience_letter_email(self, employee: Employee, pdf_path: str,
+                                      pdf_data: Optional[bytes] = None) -> Dict[str, Any]:
         """Send experience letter email with PDF attachment"""
         try:
             # Determine email subject based on employee type
-            if employee.employee_type == EmployeeType.INTERN:
+            if employee.employee_type == EmployeeType.INTERN.value:
                 subject = f"Rapid Innovation - Internship Certificate - {employee.full_name}"
                 doc_type = "Internship Certificate"
             else:
@@ -418,6 +593,7 @@ class ExperienceLetterGenerator:
                 'body_text': self.email_sender._html_to_text(body_html),
                 'attachments': [{
                     'file_path': pdf_path,
+                    'file_bytes': pdf_data,
                     'file_name': os.path.basename(pdf_path)
                 }]
             }
@@ -442,4 +618,19 @@ class ExperienceLetterGenerator:
             return {
                 'success': False,
                 'message': f'Error sending email: {str(e)}'
-            }
\ No newline at end of file
+            }
+
+
+_letter_generator = None
+
+
+def _init_letter_worker(output_dir: str):
+    """Set up a letter rendering worker process writing into the parent's output directory"""
+    global _letter_generator
+    _letter_generator = ExperienceLetterGenerator()
+    _letter_generator.output_dir = output_dir
+
+
+def _letter_worker(job: tuple) -> Optional[Tuple[str, bytes]]:
+    """Render one letter PDF inside a worker process"""
+    return _letter_generator._render_pdf(*job)
@@ -11,6 +11,7 @@ from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_RIGHT
 from database.connection import get_db_session
 from database.models import Employee, OffboardingChecklist, EmployeeType
 from modules.email.email_Sender import EmailSender
+from modules.offboarding.exit_initiation import invalidate_exit_status
 from config import config
 from utils.helpers import format_date, format_currency, calculate_fnf
 
@@ -469,6 +470,7 @@ class FnFLetterGenerator:
                     checklist.notes = f"FnF Payment Details: {payment_details}"
                 
                 session.commit()
+                invalidate_exit_status(employee_id)
                 
                 logger.info(f"FnF marked as processed for employee ID {employee_id}")
                 